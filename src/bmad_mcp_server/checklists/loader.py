@@ -2,11 +2,23 @@
 BMAD checklist loading and execution system.
 """
 
+import io
+import os
 import re
+from collections import Counter
+from functools import lru_cache
+
+import ahocorasick
+from dataclasses import dataclass, field
+
+try:
+    import pyromark  # Rust-backed markdown tokenizer; optional fast path
+except ImportError:
+    pyromark = None
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,8 +26,6 @@ logger = logging.getLogger(__name__)
 # Checklist directory
 CHECKLIST_DIR = Path(__file__).parent
 
-# Checklist cache
-_checklist_cache: Dict[str, Dict] = {}
 
 
 class ValidationMode(str, Enum):
@@ -27,40 +37,59 @@ class ValidationMode(str, Enum):
 
 class ChecklistItem(BaseModel):
     """Model for a checklist item."""
+    model_config = ConfigDict(frozen=True)
+
     text: str = Field(..., description="Checklist item text")
     required: bool = Field(default=True, description="Whether this item is required")
     category: str = Field(..., description="Category/section this item belongs to")
+    relevant_rule_keys: tuple = Field(default=(), description="Evaluation rule keywords found in the item text, precomputed at parse time")
+    na_candidate: bool = Field(default=False, description="Whether the item text marks it as conditionally applicable")
 
 
 class ChecklistSection(BaseModel):
     """Model for a checklist section."""
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(..., description="Section title")
     description: str = Field(default="", description="Section description")
     items: List[ChecklistItem] = Field(default_factory=list, description="Items in this section")
 
 
 class Checklist(BaseModel):
-    """Model for a complete checklist."""
+    """Model for a complete checklist.
+
+    Frozen (like its sections and items) because load_checklist shares one
+    parsed instance across all callers; use model_copy(deep=True) if a caller
+    ever needs a mutable copy.
+    """
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Checklist name")
     sections: List[ChecklistSection] = Field(default_factory=list, description="Checklist sections")
     total_items: int = Field(default=0, description="Total number of items")
 
 
-class ChecklistItemResult(BaseModel):
-    """Result of evaluating a checklist item."""
-    text: str = Field(..., description="Item text")
-    status: str = Field(..., description="Evaluation status: pass, fail, or na")
-    recommendation: str = Field(default="", description="Recommendation for improvement")
+@dataclass(slots=True)
+class ChecklistItemResult:
+    """Result of evaluating a checklist item.
+
+    Plain dataclass rather than a Pydantic model: one instance is created per
+    checklist item during execution, so skipping field validation matters here.
+    """
+    text: str
+    status: str  # pass, fail, or na
+    recommendation: str = ""
 
 
-class ChecklistSectionResult(BaseModel):
+@dataclass(slots=True)
+class ChecklistSectionResult:
     """Result of evaluating a checklist section."""
-    title: str = Field(..., description="Section title")
-    total: int = Field(..., description="Total items in section")
-    passed: int = Field(default=0, description="Number of passed items")
-    failed: int = Field(default=0, description="Number of failed items")
-    na: int = Field(default=0, description="Number of N/A items")
-    items: List[ChecklistItemResult] = Field(default_factory=list, description="Item results")
+    title: str
+    total: int
+    passed: int = 0
+    failed: int = 0
+    na: int = 0
+    items: List[ChecklistItemResult] = field(default_factory=list)
 
 
 class ChecklistExecutionResult(BaseModel):
@@ -75,84 +104,293 @@ class ChecklistExecutionResult(BaseModel):
     recommendations: List[str] = Field(default_factory=list, description="Overall recommendations")
 
 
+@lru_cache(maxsize=128)
 def load_checklist(checklist_name: str) -> Checklist:
-    """Load and parse a BMAD checklist."""
-    if checklist_name in _checklist_cache:
-        return Checklist(**_checklist_cache[checklist_name])
-    
+    """Load and parse a BMAD checklist.
+
+    Cached with lru_cache, whose internal locking makes concurrent loads from
+    SSE worker threads safe; parse failures are not cached and will be retried.
+    """
     checklist_path = CHECKLIST_DIR / f"{checklist_name}.md"
-    
+
     if not checklist_path.exists():
         raise FileNotFoundError(f"Checklist not found: {checklist_name}")
-    
+
     try:
-        with open(checklist_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        parsed_checklist = _parse_checklist_content(content, checklist_name)
-        _checklist_cache[checklist_name] = parsed_checklist.model_dump()
-        
-        return parsed_checklist
-        
+        # Single read + decode; skips the TextIOWrapper/BufferedReader layers
+        content = checklist_path.read_bytes().decode('utf-8')
+
+        return _parse_checklist_content(content, checklist_name)
+
     except Exception as e:
         raise Exception(f"Error loading checklist {checklist_name}: {e}")
 
 
 def _parse_checklist_content(content: str, checklist_name: str) -> Checklist:
-    """Parse checklist markdown content into structured format."""
-    
-    checklist = Checklist(name=checklist_name)
-    current_section = None
-    lines = content.split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        
-        # Section headers (## or ###)
-        if line.startswith('##') and not line.startswith('###'):
-            if current_section:
-                checklist.sections.append(current_section)
-            
-            section_title = line.replace('#', '').strip()
-            current_section = ChecklistSection(title=section_title)
-        
+    """Parse checklist markdown content into structured format.
+
+    Uses the compiled pyromark tokenizer when available; falls back to the
+    pure-Python line parser otherwise. Both produce the same structure for
+    BMAD checklist files.
+    """
+    if pyromark is not None:
+        return _parse_checklist_events(content, checklist_name)
+    return _parse_checklist_lines(content, checklist_name)
+
+
+def _build_item(text: str, category: str) -> ChecklistItem:
+    """Construct a ChecklistItem with its evaluation keywords precomputed.
+
+    Scanning the item text for rule and applicability keywords here means
+    _evaluate_checklist_item reads a ready-made tuple instead of repeating
+    the substring checks on every execute_checklist call.
+    """
+    item_lower = text.lower()
+    return ChecklistItem(
+        text=text,
+        required=True,
+        category=category,
+        relevant_rule_keys=tuple(
+            keyword for keyword in _EVALUATION_RULES if keyword in item_lower
+        ),
+        na_candidate=any(na_keyword in item_lower for na_keyword in _NA_KEYWORDS),
+    )
+
+
+def _parse_checklist_events(content: str, checklist_name: str) -> Checklist:
+    """Build a Checklist from pyromark's native-code event stream.
+
+    Sections are accumulated in plain locals and the (frozen) models are
+    constructed only once each section is complete.
+    """
+
+    sections: List[ChecklistSection] = []
+    section_title: Optional[str] = None  # None while no section is open
+    description_parts: List[str] = []
+    items: List[ChecklistItem] = []
+    total_items = 0
+    heading_mode: Optional[str] = None  # "h2" collects a section title, "skip" swallows other headings
+    in_item = False
+    item_unchecked = False
+    buf: List[str] = []
+
+    def _flush_section() -> None:
+        nonlocal section_title, description_parts, items
+        if section_title is not None:
+            sections.append(ChecklistSection(
+                title=section_title,
+                description=" ".join(description_parts),
+                items=items
+            ))
+        section_title = None
+        description_parts = []
+        items = []
+
+    for event in pyromark.events(content, options=pyromark.Options.ENABLE_TASKLISTS):
+        if event == "SoftBreak" or event == "HardBreak":
+            buf.append(" ")
+        elif not isinstance(event, dict):
+            continue
+        elif "Text" in event:
+            if heading_mode != "skip":
+                buf.append(event["Text"])
+        elif "Code" in event:
+            if heading_mode != "skip":
+                buf.append(event["Code"])
+        elif "TaskListMarker" in event:
+            item_unchecked = not event["TaskListMarker"]
+        elif "Start" in event:
+            start = event["Start"]
+            if isinstance(start, dict) and "Heading" in start:
+                if start["Heading"]["level"] == "H2":
+                    _flush_section()
+                    heading_mode = "h2"
+                else:
+                    heading_mode = "skip"
+                buf = []
+            elif start == "Item":
+                in_item = True
+                item_unchecked = False
+                buf = []
+            elif start == "Paragraph" and not in_item:
+                buf = []
+        elif "End" in event:
+            end = event["End"]
+            if isinstance(end, dict) and "Heading" in end:
+                if heading_mode == "h2":
+                    section_title = "".join(buf).strip()
+                heading_mode = None
+                buf = []
+            elif end == "Item":
+                if in_item and item_unchecked and section_title is not None:
+                    items.append(_build_item("".join(buf).strip(), section_title))
+                    total_items += 1
+                in_item = False
+                buf = []
+            elif end == "Paragraph" and not in_item:
+                description = "".join(buf).strip()
+                if section_title is not None and description:
+                    description_parts.append(description)
+                buf = []
+
+    _flush_section()
+
+    return Checklist(name=checklist_name, sections=sections, total_items=total_items)
+
+
+# Classifies a stripped checklist line as heading, unchecked item, or
+# description in a single C-level match instead of a startswith/replace chain.
+# Bullet lines that are not unchecked items (e.g. "- [x] ...") match no branch.
+_CHECKLIST_LINE_RE = re.compile(
+    r'(?:(?P<hashes>#+)(?P<title>.*)'
+    r'|- \[ \](?P<item>.*)'
+    r'|(?P<desc>[^#-].*))$'
+)
+
+
+def _parse_checklist_lines(content: str, checklist_name: str) -> Checklist:
+    """Pure-Python fallback parser using line-by-line iteration.
+
+    Like the event parser, accumulates each section in locals and constructs
+    the (frozen) models only when the section is complete.
+    """
+
+    sections: List[ChecklistSection] = []
+    section_title: Optional[str] = None  # None while no section is open
+    description_parts: List[str] = []
+    items: List[ChecklistItem] = []
+    total_items = 0
+
+    def _flush_section() -> None:
+        nonlocal description_parts, items
+        if section_title is not None:
+            sections.append(ChecklistSection(
+                title=section_title,
+                description=" ".join(description_parts),
+                items=items
+            ))
+        description_parts = []
+        items = []
+
+    # StringIO yields lines lazily, avoiding split('\n')'s full list of lines
+    for line in io.StringIO(content):
+        match = _CHECKLIST_LINE_RE.match(line.strip())
+        if match is None:
+            continue
+
+        # Section headers (##; deeper headings are ignored)
+        if match.group('hashes') is not None:
+            if len(match.group('hashes')) == 2:
+                _flush_section()
+                section_title = match.group('title').replace('#', '').strip()
+
         # Checklist items (- [ ])
-        elif line.startswith('- [ ]'):
-            if current_section:
-                item_text = line.replace('- [ ]', '').strip()
-                item = ChecklistItem(
-                    text=item_text,
-                    required=True,
-                    category=current_section.title
-                )
-                current_section.items.append(item)
-                checklist.total_items += 1
-        
+        elif match.group('item') is not None:
+            if section_title is not None:
+                item_text = match.group('item').replace('- [ ]', '').strip()
+                items.append(_build_item(item_text, section_title))
+                total_items += 1
+
         # Section descriptions
-        elif current_section and line and not line.startswith('#') and not line.startswith('-'):
-            if current_section.description:
-                current_section.description += " " + line
-            else:
-                current_section.description = line
-    
+        elif section_title is not None:
+            description_parts.append(match.group('desc'))
+
     # Add final section
-    if current_section:
-        checklist.sections.append(current_section)
-    
-    return checklist
+    _flush_section()
+
+    return Checklist(name=checklist_name, sections=sections, total_items=total_items)
+
+
+# Keywords marking an item as conditionally applicable, and the document
+# keywords that decide whether such an item applies at all.
+_NA_KEYWORDS = ("if applicable", "if needed", "optional")
+_UI_SURFACE_KEYWORDS = ("ui", "frontend", "api", "database")
+
+# Trigger-word groups for content presence rules: an item keyword is satisfied
+# if any of its trigger words appears in the document.
+_CONTENT_TRIGGER_GROUPS: Dict[str, frozenset] = {
+    "clear": frozenset({"clear", "clearly", "specific", "detailed"}),
+    "goal": frozenset({"goal"}),
+    "requirement": frozenset({"requirement", "must", "should", "shall"}),
+    "user": frozenset({"user"}),
+    "story": frozenset({"story"}),
+    "acceptance": frozenset({"acceptance", "criteria"}),
+    "epic": frozenset({"epic"}),
+    "architecture": frozenset({"architecture"}),
+    "technical": frozenset({"technical", "technology", "tech"}),
+    "testing": frozenset({"test", "testing", "quality"}),
+    "security": frozenset({"security"}),
+}
+
+# Union of all trigger words, scanned once per document in
+# _compute_document_features rather than once per checklist item.
+_ALL_TRIGGER_WORDS = frozenset().union(*_CONTENT_TRIGGER_GROUPS.values())
+
+
+def _build_trigger_automaton() -> ahocorasick.Automaton:
+    """Build the Aho-Corasick automaton over all trigger words.
+
+    A single automaton pass over the document replaces one substring scan per
+    trigger word; iter() reports every word occurrence, including words
+    contained in longer ones (e.g. "clear" within "clearly").
+    """
+    automaton = ahocorasick.Automaton()
+    for word in _ALL_TRIGGER_WORDS:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+_TRIGGER_AUTOMATON = _build_trigger_automaton()
+
+# Simple keyword-based evaluation rules (in real implementation would be more
+# sophisticated). Each rule is a predicate over the precomputed per-document
+# feature dict; built once at import instead of per item evaluation.
+_EVALUATION_RULES: Dict[str, Any] = {
+    # Content presence rules
+    **{
+        keyword: (lambda triggers: lambda features: bool(features["present_keywords"] & triggers))(triggers)
+        for keyword, triggers in _CONTENT_TRIGGER_GROUPS.items()
+    },
+
+    # Structure rules
+    "section": lambda features: features["hash_count"] >= 3,  # Has multiple sections
+    "list": lambda features: features["dash_count"] >= 3,     # Has lists
+    "table": lambda features: features["has_pipe"],           # Has tables
+
+    # Length rules
+    "comprehensive": lambda features: features["doc_len"] > 2000,
+    "detailed": lambda features: features["doc_len"] > 1000,
+    "brief": lambda features: features["doc_len"] < 1000,
+}
+
+
+def _compute_document_features(document_content: str) -> Dict[str, Any]:
+    """Precompute per-document signals shared by all item evaluations."""
+    doc_lower = document_content.lower()
+    return {
+        "doc_lower": doc_lower,
+        "doc_len": len(document_content),
+        "hash_count": doc_lower.count("#"),
+        "dash_count": doc_lower.count("-"),
+        "has_pipe": "|" in doc_lower,
+        "present_keywords": frozenset(word for _, word in _TRIGGER_AUTOMATON.iter(doc_lower)),
+        "has_ui_surface": any(keyword in doc_lower for keyword in _UI_SURFACE_KEYWORDS),
+    }
 
 
 def execute_checklist(
-    checklist: Checklist, 
-    document_content: str, 
-    context: Optional[Dict[str, Any]] = None, 
+    checklist: Checklist,
+    document_content: str,
+    context: Optional[Dict[str, Any]] = None,
     mode: str = "standard"
 ) -> ChecklistExecutionResult:
     """Execute checklist against document content."""
-    
+
     context = context or {}
     validation_mode = ValidationMode(mode)
-    
+    features = _compute_document_features(document_content)
+
     result = ChecklistExecutionResult(
         checklist_name=checklist.name,
         total_items=checklist.total_items
@@ -166,7 +404,7 @@ def execute_checklist(
         
         for item in section.items:
             item_result = _evaluate_checklist_item(
-                item, document_content, context, validation_mode
+                item, features, context, validation_mode
             )
             
             section_result.items.append(item_result)
@@ -195,65 +433,36 @@ def execute_checklist(
 
 
 def _evaluate_checklist_item(
-    item: ChecklistItem, 
-    document_content: str, 
-    context: Dict[str, Any], 
+    item: ChecklistItem,
+    features: Dict[str, Any],
+    context: Dict[str, Any],
     mode: ValidationMode
 ) -> ChecklistItemResult:
-    """Evaluate a single checklist item against document content."""
-    
-    item_text = item.text.lower()
-    doc_lower = document_content.lower()
-    
-    # Simple keyword-based evaluation (in real implementation would be more sophisticated)
-    evaluation_rules = {
-        # Content presence rules
-        "clear": lambda: any(word in doc_lower for word in ["clear", "clearly", "specific", "detailed"]),
-        "goal": lambda: "goal" in doc_lower,
-        "requirement": lambda: any(word in doc_lower for word in ["requirement", "must", "should", "shall"]),
-        "user": lambda: "user" in doc_lower,
-        "story": lambda: "story" in doc_lower,
-        "acceptance": lambda: "acceptance" in doc_lower or "criteria" in doc_lower,
-        "epic": lambda: "epic" in doc_lower,
-        "architecture": lambda: "architecture" in doc_lower,
-        "technical": lambda: any(word in doc_lower for word in ["technical", "technology", "tech"]),
-        "testing": lambda: any(word in doc_lower for word in ["test", "testing", "quality"]),
-        "security": lambda: "security" in doc_lower,
-        
-        # Structure rules
-        "section": lambda: doc_lower.count("#") >= 3,  # Has multiple sections
-        "list": lambda: doc_lower.count("-") >= 3,     # Has lists
-        "table": lambda: "|" in doc_lower,             # Has tables
-        
-        # Length rules
-        "comprehensive": lambda: len(document_content) > 2000,
-        "detailed": lambda: len(document_content) > 1000,
-        "brief": lambda: len(document_content) < 1000,
-    }
-    
+    """Evaluate a single checklist item against precomputed document features.
+
+    Uses the rule keys and applicability flag precomputed on the item at
+    parse time rather than re-scanning the item text per execution.
+    """
+
     # Determine item status based on keywords and rules
-    status = "fail"  # Default to fail
-    recommendation = ""
-    
+    status: str = "fail"  # Default to fail
+    recommendation: str = ""
+
     # Check if item is applicable
-    if any(na_keyword in item_text for na_keyword in ["if applicable", "if needed", "optional"]):
+    if item.na_candidate:
         # Check if the optional item applies to this document
-        if not any(keyword in doc_lower for keyword in ["ui", "frontend", "api", "database"]):
+        if not features["has_ui_surface"]:
             status = "na"
-    
+
     if status != "na":
         # Apply evaluation rules
-        relevant_rules = []
-        for keyword, rule_func in evaluation_rules.items():
-            if keyword in item_text:
-                relevant_rules.append(rule_func)
-        
-        if relevant_rules:
+        if item.relevant_rule_keys:
             # All relevant rules must pass in strict mode, most in standard, some in lenient
-            rule_results = [rule() for rule in relevant_rules]
-            pass_count = sum(rule_results)
-            total_rules = len(rule_results)
-            
+            pass_count: int = sum(
+                _EVALUATION_RULES[keyword](features) for keyword in item.relevant_rule_keys
+            )
+            total_rules: int = len(item.relevant_rule_keys)
+
             if mode == ValidationMode.STRICT:
                 status = "pass" if pass_count == total_rules else "fail"
             elif mode == ValidationMode.STANDARD:
@@ -262,18 +471,20 @@ def _evaluate_checklist_item(
                 status = "pass" if pass_count >= (total_rules * 0.5) else "fail"
         else:
             # No specific rules, do general content check
-            if len(document_content) > 100:  # Has substantial content
+            if features["doc_len"] > 100:  # Has substantial content
                 status = "pass"
     
-    # Generate recommendation for failed items
+    # Generate recommendation for failed items ("clear", "goal", etc. are all
+    # rule keywords, so the precomputed keys cover the same membership checks)
     if status == "fail":
-        if "clear" in item_text:
+        rule_keys = item.relevant_rule_keys
+        if "clear" in rule_keys:
             recommendation = "Add more specific and detailed explanations"
-        elif "goal" in item_text:
+        elif "goal" in rule_keys:
             recommendation = "Define clear, measurable goals"
-        elif "requirement" in item_text:
+        elif "requirement" in rule_keys:
             recommendation = "Add explicit requirements with clear language"
-        elif "testing" in item_text:
+        elif "testing" in rule_keys:
             recommendation = "Include testing strategy and requirements"
         else:
             recommendation = "Review and enhance this aspect of the document"
@@ -285,32 +496,49 @@ def _evaluate_checklist_item(
     )
 
 
+# Pass-rate recommendation text, built once rather than per call
+_LOW_PASS_RATE_RECOMMENDATIONS = [
+    "Document requires significant improvement before proceeding to next phase",
+    "Focus on addressing failed items systematically",
+]
+_MID_PASS_RATE_RECOMMENDATION = "Document is good but could benefit from addressing remaining failed items"
+
+
 def _generate_recommendations(result: ChecklistExecutionResult, mode: ValidationMode) -> List[str]:
     """Generate overall recommendations based on validation results."""
-    
+
     recommendations = []
-    
+
     pass_rate = (result.passed_items / result.total_items * 100) if result.total_items > 0 else 0
-    
+
     if pass_rate < 70:
-        recommendations.append("Document requires significant improvement before proceeding to next phase")
-        recommendations.append("Focus on addressing failed items systematically")
+        recommendations.extend(_LOW_PASS_RATE_RECOMMENDATIONS)
     elif pass_rate < 85:
-        recommendations.append("Document is good but could benefit from addressing remaining failed items")
-    
+        recommendations.append(_MID_PASS_RATE_RECOMMENDATION)
+
     # Analyze failed items by category
-    failed_categories = {}
-    for item in result.failed_items_details:
-        category = item["category"]
-        failed_categories[category] = failed_categories.get(category, 0) + 1
-    
-    if failed_categories:
-        worst_category = max(failed_categories.items(), key=lambda x: x[1])
-        recommendations.append(f"Pay special attention to '{worst_category[0]}' section - {worst_category[1]} items need improvement")
-    
+    if result.failed_items_details:
+        category_counts = Counter(item["category"] for item in result.failed_items_details)
+        worst_category, worst_count = category_counts.most_common(1)[0]
+        recommendations.append(f"Pay special attention to '{worst_category}' section - {worst_count} items need improvement")
+
     return recommendations
 
 
+@lru_cache(maxsize=8)
+def _scan_checklist_dir(dir_path: str, _mtime_ns: int) -> tuple:
+    """Snapshot checklist names via a single os.scandir pass.
+
+    Keyed on the directory mtime so the cache invalidates when files are
+    added or removed without re-walking an unchanged directory.
+    """
+    with os.scandir(dir_path) as entries:
+        return tuple(sorted(
+            entry.name[:-3] for entry in entries
+            if entry.name.endswith(".md") and entry.is_file()
+        ))
+
+
 def list_checklists() -> List[str]:
     """List available BMAD checklists."""
-    return [f.stem for f in CHECKLIST_DIR.glob("*.md")]
+    return list(_scan_checklist_dir(str(CHECKLIST_DIR), os.stat(CHECKLIST_DIR).st_mtime_ns))
@@ -2,96 +2,112 @@
 BMAD agent definitions for CrewAI integration.
 """
 
-from crewai import Agent
-from typing import Optional, Any
+from typing import TYPE_CHECKING, Dict, Optional, Any, Tuple
 import logging
 
 from .config import CrewAIConfig # Import the CrewAIConfig class
 
+if TYPE_CHECKING:
+    from crewai import Agent
+
 logger = logging.getLogger(__name__)
 
 
-def get_analyst_agent(config: CrewAIConfig) -> Agent:
-    """Get configured BMAD Analyst agent using provided CrewAIConfig."""
-    llm_identifier = config.get_llm_identifier_for_agent("analyst")
-    logger.debug(f"Analyst agent LLM identifier: {llm_identifier}")
-    return Agent(
-        role="Senior Research Specialist and Business Analyst",
-        goal="Conduct thorough analysis and create comprehensive project documentation that establishes clear foundations for development",
-        backstory="""You are an experienced analyst with a talent for understanding complex business requirements
+# Static role definitions; Agent instances are built lazily from these specs
+# and memoized per (agent type, LLM identifier, verbosity, max_iter) so repeat
+# tool invocations with the same configuration reuse the same agent.
+_AGENT_SPECS: Dict[str, Dict[str, str]] = {
+    "analyst": {
+        "role": "Senior Research Specialist and Business Analyst",
+        "goal": "Conduct thorough analysis and create comprehensive project documentation that establishes clear foundations for development",
+        "backstory": """You are an experienced analyst with a talent for understanding complex business requirements
         and translating them into clear, actionable project documentation. You excel at asking the right questions,
         identifying key constraints and opportunities, and structuring information in a way that guides successful
         project execution. You follow the BMAD methodology strictly and ensure all outputs meet quality standards.""",
-        verbose=config.verbose_logging,
-        max_iter=config.max_iter,
-        llm=llm_identifier 
-    )
-
-
-def get_pm_agent(config: CrewAIConfig) -> Agent:
-    """Get configured BMAD Product Manager agent using provided CrewAIConfig."""
-    llm_identifier = config.get_llm_identifier_for_agent("pm")
-    logger.debug(f"PM agent LLM identifier: {llm_identifier}")
-    return Agent(
-        role="Senior Product Manager and Requirements Specialist",
-        goal="Transform project briefs into comprehensive PRDs with well-structured epics and user stories",
-        backstory="""You are a seasoned product manager with deep expertise in requirement gathering and
+    },
+    "pm": {
+        "role": "Senior Product Manager and Requirements Specialist",
+        "goal": "Transform project briefs into comprehensive PRDs with well-structured epics and user stories",
+        "backstory": """You are a seasoned product manager with deep expertise in requirement gathering and
         product definition. You excel at breaking down complex projects into manageable epics and stories,
         ensuring clear acceptance criteria, and maintaining focus on MVP goals. You follow BMAD methodology
         principles and create PRDs that serve as solid foundations for architecture and development work.""",
-        verbose=config.verbose_logging,
-        max_iter=config.max_iter,
-        llm=llm_identifier
-    )
-
-
-def get_architect_agent(config: CrewAIConfig) -> Agent:
-    """Get configured BMAD Architect agent using provided CrewAIConfig."""
-    llm_identifier = config.get_llm_identifier_for_agent("architect")
-    logger.debug(f"Architect agent LLM identifier: {llm_identifier}")
-    return Agent(
-        role="Senior Software Architect and Technical Leader",
-        goal="Design robust, scalable technical architectures that meet all requirements and follow best practices",
-        backstory="""You are an experienced software architect with expertise in designing systems that are
+    },
+    "architect": {
+        "role": "Senior Software Architect and Technical Leader",
+        "goal": "Design robust, scalable technical architectures that meet all requirements and follow best practices",
+        "backstory": """You are an experienced software architect with expertise in designing systems that are
         maintainable, scalable, and aligned with business requirements. You excel at making clear technical
         decisions, documenting architectural patterns, and ensuring designs are optimized for AI-agent
         implementation. You follow BMAD architecture principles and create documentation that enables
         successful development execution.""",
-        verbose=config.verbose_logging,
-        max_iter=config.max_iter,
-        llm=llm_identifier
-    )
-
-
-def get_developer_agent(config: CrewAIConfig) -> Agent:
-    """Get configured BMAD Developer agent using provided CrewAIConfig."""
-    llm_identifier = config.get_llm_identifier_for_agent("developer") # Assuming "developer" key in config
-    logger.debug(f"Developer agent LLM identifier: {llm_identifier}")
-    return Agent(
-        role="Senior Software Developer and Implementation Specialist",
-        goal="Create high-quality, well-documented code that implements user stories and follows architectural guidelines",
-        backstory="""You are an expert software developer with deep knowledge of modern development practices,
+    },
+    "developer": {
+        "role": "Senior Software Developer and Implementation Specialist",
+        "goal": "Create high-quality, well-documented code that implements user stories and follows architectural guidelines",
+        "backstory": """You are an expert software developer with deep knowledge of modern development practices,
         testing methodologies, and code quality standards. You excel at translating user stories and technical
         specifications into clean, maintainable code. You follow BMAD development principles and ensure all
         implementations are properly tested and documented.""",
-        verbose=config.verbose_logging,
-        max_iter=config.max_iter,
-        llm=llm_identifier
-    )
-
-
-def get_qa_agent(config: CrewAIConfig) -> Agent:
-    """Get configured BMAD Quality Assurance agent using provided CrewAIConfig."""
-    llm_identifier = config.get_llm_identifier_for_agent("qa") # Assuming "qa" key in config
-    logger.debug(f"QA agent LLM identifier: {llm_identifier}")
-    return Agent(
-        role="Senior Quality Assurance Specialist and Validation Expert",
-        goal="Ensure all BMAD artifacts and deliverables meet quality standards through systematic validation",
-        backstory="""You are a meticulous quality assurance professional with expertise in validation frameworks,
+    },
+    "qa": {
+        "role": "Senior Quality Assurance Specialist and Validation Expert",
+        "goal": "Ensure all BMAD artifacts and deliverables meet quality standards through systematic validation",
+        "backstory": """You are a meticulous quality assurance professional with expertise in validation frameworks,
         testing strategies, and quality metrics. You excel at running comprehensive checklists, identifying gaps
         in documentation or implementation, and providing actionable feedback for improvement. You follow BMAD
         quality standards and ensure all deliverables are ready for the next phase.""",
-        verbose=config.verbose_logging,
-        max_iter=config.max_iter,
-        llm=llm_identifier
-    )
+    },
+}
+
+# Memoized agents, keyed by the configuration values that affect construction
+_agent_cache: Dict[Tuple[str, Optional[str], bool, int], "Agent"] = {}
+
+
+def _get_agent(agent_type: str, config: CrewAIConfig) -> "Agent":
+    """Return the memoized agent for this type/config, building it on first use."""
+    llm_identifier = config.get_llm_identifier_for_agent(agent_type)
+    cache_key = (agent_type, llm_identifier, config.verbose_logging, config.max_iter)
+
+    agent = _agent_cache.get(cache_key)
+    if agent is None:
+        # Imported here so that config-only consumers of this package don't
+        # pay CrewAI's import cost at startup
+        from crewai import Agent
+        logger.debug(f"{agent_type.capitalize()} agent LLM identifier: {llm_identifier}")
+        spec = _AGENT_SPECS[agent_type]
+        agent = Agent(
+            role=spec["role"],
+            goal=spec["goal"],
+            backstory=spec["backstory"],
+            verbose=config.verbose_logging,
+            max_iter=config.max_iter,
+            llm=llm_identifier
+        )
+        _agent_cache[cache_key] = agent
+    return agent
+
+
+def get_analyst_agent(config: CrewAIConfig) -> "Agent":
+    """Get configured BMAD Analyst agent using provided CrewAIConfig."""
+    return _get_agent("analyst", config)
+
+
+def get_pm_agent(config: CrewAIConfig) -> "Agent":
+    """Get configured BMAD Product Manager agent using provided CrewAIConfig."""
+    return _get_agent("pm", config)
+
+
+def get_architect_agent(config: CrewAIConfig) -> "Agent":
+    """Get configured BMAD Architect agent using provided CrewAIConfig."""
+    return _get_agent("architect", config)
+
+
+def get_developer_agent(config: CrewAIConfig) -> "Agent":
+    """Get configured BMAD Developer agent using provided CrewAIConfig."""
+    return _get_agent("developer", config)
+
+
+def get_qa_agent(config: CrewAIConfig) -> "Agent":
+    """Get configured BMAD Quality Assurance agent using provided CrewAIConfig."""
+    return _get_agent("qa", config)
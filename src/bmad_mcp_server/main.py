@@ -10,6 +10,11 @@ import logging
 import click
 from rich.console import Console
 
+try:
+    import uvloop  # libuv-backed event loop; not available on Windows
+except ImportError:
+    uvloop = None
+
 from .server import BMadMCPServer
 from .utils.logging import setup_logging
 
@@ -61,10 +66,15 @@ def main(mode, host, port, config, project_root, log_level):
     """
     # Setup basic logging first
     setup_logging(level=log_level)
-    
+
+    # Use uvloop when available; reduces per-I/O overhead for long-lived
+    # SSE connections with no application code changes
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+
     try:
         # Create and run server for all modes
-        asyncio.run(_run_server(mode, host, port, config, project_root))
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(_run_server(mode, host, port, config, project_root))
     except KeyboardInterrupt:
         console.print("\n[yellow]Server stopped by user[/yellow]")
     except Exception as e:
@@ -98,5 +108,15 @@ async def _run_server(mode, host, port, config, project_root):
         raise
 
 
+def stdio_entry() -> None:
+    """Console-script entry point for stdio mode (bmad-mcp-stdio)."""
+    main(["--mode", "stdio", *sys.argv[1:]])
+
+
+def sse_entry() -> None:
+    """Console-script entry point for SSE mode (bmad-mcp-sse)."""
+    main(["--mode", "sse", *sys.argv[1:]])
+
+
 if __name__ == "__main__":
     main()
@@ -8,12 +8,18 @@ tool execution and protocol handling for the BMAD methodology.
 import asyncio
 import json
 import logging
+import weakref
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Literal
 
 from fastmcp import FastMCP
 from pydantic import BaseModel
 
+try:
+    import orjson  # Rust-backed JSON parsing; optional fast path
+except ImportError:
+    orjson = None
+
 from .utils.state_manager import StateManager
 from .utils.logging import setup_logging
 from .crewai_integration.config import CrewAIConfig
@@ -63,6 +69,11 @@ class BMadMCPServer:
         self.state_manager = StateManager(project_root=self.project_root)
         self.crewai_config = CrewAIConfig() # TODO: Pass LLM configs from server_config to crewai_config
         
+        # Tasks spawned by this server; a WeakSet so completed tasks drop out
+        # without bookkeeping, and shutdown only cancels our own work instead
+        # of sweeping every task in the loop
+        self._tasks: "weakref.WeakSet[asyncio.Task]" = weakref.WeakSet()
+
         # Initialize FastMCP server
         self.mcp = FastMCP("BMAD-Server", version="1.0.0")
         
@@ -87,8 +98,8 @@ class BMadMCPServer:
         
         if config_path and config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    user_config = json.load(f)
+                raw = config_path.read_bytes()
+                user_config = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 default_config.update(user_config)
                 logger.info(f"Loaded configuration from {config_path}")
             except Exception as e:
@@ -99,6 +110,31 @@ class BMadMCPServer:
     def _register_native_tools(self) -> None:
         """Register all BMAD tools with FastMCP using explicit function definitions."""
 
+        # Tools are stateless between calls, so construct each once here rather
+        # than per invocation inside the wrappers (template loads, schema
+        # derivation and CrewAI config wiring happen at startup, not per request)
+        self._brief_tool = CreateProjectBriefTool(self.state_manager, self.crewai_config)
+        self._prd_tool = GeneratePRDTool(self.state_manager, self.crewai_config)
+        self._requirements_tool = ValidateRequirementsTool(self.state_manager, self.crewai_config)
+        self._architecture_tool = CreateArchitectureTool(self.state_manager, self.crewai_config)
+        self._frontend_tool = CreateFrontendArchitectureTool(self.state_manager, self.crewai_config)
+        self._story_tool = CreateNextStoryTool(self.state_manager, self.crewai_config)
+        self._story_validation_tool = ValidateStoryTool(self.state_manager, self.crewai_config)
+        self._checklist_tool = RunChecklistTool(self.state_manager, self.crewai_config)
+        self._correct_course_tool = CorrectCourseTool(self.state_manager, self.crewai_config)
+
+        self._native_tools = (
+            self._brief_tool,
+            self._prd_tool,
+            self._requirements_tool,
+            self._architecture_tool,
+            self._frontend_tool,
+            self._story_tool,
+            self._story_validation_tool,
+            self._checklist_tool,
+            self._correct_course_tool,
+        )
+
         # --- Planning Tools ---
         @self.mcp.tool()
         async def create_project_brief(
@@ -109,7 +145,7 @@ class BMadMCPServer:
             additional_context: Optional[str] = ""
         ) -> Dict[str, Any]:
             """Generate a structured project brief following BMAD methodology."""
-            tool_instance = CreateProjectBriefTool(self.state_manager, self.crewai_config)
+            tool_instance = self._brief_tool
             # The tool's execute method expects a dict, matching its Pydantic model
             return await tool_instance.execute({
                 "topic": topic,
@@ -127,13 +163,13 @@ class BMadMCPServer:
             include_architecture_prompt: bool = True
         ) -> Dict[str, Any]:
             """Generate comprehensive PRD with epics and user stories from project brief."""
-            tool_instance = GeneratePRDTool(self.state_manager, self.crewai_config)
-            return await tool_instance.execute({
-                "project_brief_content": project_brief_content,
-                "workflow_mode": workflow_mode,
-                "technical_depth": technical_depth,
-                "include_architecture_prompt": include_architecture_prompt
-            })
+            # Build the request model once; the tool skips re-validating a dict
+            return await self._prd_tool.execute_model(PRDGenerationRequest(
+                project_brief_content=project_brief_content,
+                workflow_mode=workflow_mode,
+                technical_depth=technical_depth,
+                include_architecture_prompt=include_architecture_prompt
+            ))
 
         @self.mcp.tool()
         async def validate_requirements(
@@ -143,13 +179,12 @@ class BMadMCPServer:
             include_recommendations: bool = True
         ) -> Dict[str, Any]:
             """Validate PRD documents against PM quality checklists."""
-            tool_instance = ValidateRequirementsTool(self.state_manager, self.crewai_config)
-            return await tool_instance.execute({
-                "prd_content": prd_content,
-                "checklist_type": checklist_type,
-                "validation_mode": validation_mode,
-                "include_recommendations": include_recommendations
-            })
+            return await self._requirements_tool.execute_model(RequirementsValidationRequest(
+                prd_content=prd_content,
+                checklist_type=checklist_type,
+                validation_mode=validation_mode,
+                include_recommendations=include_recommendations
+            ))
 
         # --- Architecture Tools ---
         @self.mcp.tool()
@@ -160,15 +195,14 @@ class BMadMCPServer:
             include_frontend_prompt: bool = True
         ) -> Dict[str, Any]:
             """Generate comprehensive technical architecture from PRD requirements."""
-            tool_instance = CreateArchitectureTool(self.state_manager, self.crewai_config)
-            # Pass tech_preferences as a dict if not None, else Pydantic model in tool will use default_factory
-            tech_prefs_dict = tech_preferences.model_dump() if tech_preferences else {}
-            return await tool_instance.execute({
-                "prd_content": prd_content,
-                "tech_preferences": tech_prefs_dict,
-                "architecture_type": architecture_type,
-                "include_frontend_prompt": include_frontend_prompt
-            })
+            # FastMCP already validated tech_preferences; pass the model
+            # instance through instead of a model_dump() round-trip
+            return await self._architecture_tool.execute_model(ArchitectureRequest(
+                prd_content=prd_content,
+                tech_preferences=tech_preferences or TechPreferences(),
+                architecture_type=architecture_type,
+                include_frontend_prompt=include_frontend_prompt
+            ))
 
         @self.mcp.tool()
         async def create_frontend_architecture(
@@ -179,14 +213,13 @@ class BMadMCPServer:
             state_management: Optional[Literal["Redux", "Zustand", "Context API", "Vuex", "Pinia", "NgRx", ""]] = ""
         ) -> Dict[str, Any]:
             """Generate frontend-specific architecture specifications."""
-            tool_instance = CreateFrontendArchitectureTool(self.state_manager, self.crewai_config)
-            return await tool_instance.execute({
-                "main_architecture": main_architecture,
-                "ux_specification": ux_specification,
-                "framework_preference": framework_preference,
-                "component_strategy": component_strategy,
-                "state_management": state_management
-            })
+            return await self._frontend_tool.execute_model(FrontendArchitectureRequest(
+                main_architecture=main_architecture,
+                ux_specification=ux_specification,
+                framework_preference=framework_preference,
+                component_strategy=component_strategy,
+                state_management=state_management
+            ))
 
         # --- Story Tools ---
         @self.mcp.tool()
@@ -198,15 +231,13 @@ class BMadMCPServer:
             priority: Literal["low", "medium", "high", "critical"] = "medium"
         ) -> Dict[str, Any]:
             """Generate development-ready user stories from PRD epics."""
-            tool_instance = CreateNextStoryTool(self.state_manager, self.crewai_config)
-            current_progress_dict = current_progress.model_dump() if current_progress else {}
-            return await tool_instance.execute({
-                "prd_content": prd_content,
-                "architecture_content": architecture_content,
-                "current_progress": current_progress_dict,
-                "story_type": story_type,
-                "priority": priority
-            })
+            return await self._story_tool.execute_model(CreateStoryRequest(
+                prd_content=prd_content,
+                architecture_content=architecture_content,
+                current_progress=current_progress or CurrentProgress(),
+                story_type=story_type,
+                priority=priority
+            ))
 
         @self.mcp.tool()
         async def validate_story(
@@ -216,13 +247,12 @@ class BMadMCPServer:
             story_phase: Literal["draft", "review", "ready", "in_progress", "done"] = "draft"
         ) -> Dict[str, Any]:
             """Validate user stories against Definition of Done checklists."""
-            tool_instance = ValidateStoryTool(self.state_manager, self.crewai_config)
-            return await tool_instance.execute({
-                "story_content": story_content,
-                "checklist_types": checklist_types or ["story_draft_checklist"], # Default if None
-                "validation_mode": validation_mode,
-                "story_phase": story_phase
-            })
+            return await self._story_validation_tool.execute_model(StoryValidationRequest(
+                story_content=story_content,
+                checklist_types=checklist_types or ["story_draft_checklist"], # Default if None
+                validation_mode=validation_mode,
+                story_phase=story_phase
+            ))
 
         # --- Validation Tools ---
         @self.mcp.tool()
@@ -233,14 +263,12 @@ class BMadMCPServer:
             validation_mode: Literal["strict", "standard", "lenient"] = "standard"
         ) -> Dict[str, Any]:
             """Execute BMAD quality checklists against documents."""
-            tool_instance = RunChecklistTool(self.state_manager, self.crewai_config)
-            validation_context_dict = validation_context.model_dump() if validation_context else {}
-            return await tool_instance.execute({
-                "document_content": document_content,
-                "checklist_name": checklist_name.value, # Pass enum value
-                "validation_context": validation_context_dict,
-                "validation_mode": validation_mode
-            })
+            return await self._checklist_tool.execute_model(ChecklistRequest(
+                document_content=document_content,
+                checklist_name=checklist_name,
+                validation_context=validation_context or ValidationContext(),
+                validation_mode=validation_mode
+            ))
 
         @self.mcp.tool()
         async def correct_course(
@@ -251,17 +279,22 @@ class BMadMCPServer:
             constraints: Optional[List[str]] = None
         ) -> Dict[str, Any]:
             """Handle change management scenarios and course corrections."""
-            tool_instance = CorrectCourseTool(self.state_manager, self.crewai_config)
-            return await tool_instance.execute({
-                "current_situation": current_situation,
-                "desired_outcome": desired_outcome,
-                "change_context": change_context.model_dump(), # Pass as dict
-                "existing_artifacts": existing_artifacts or [],
-                "constraints": constraints or []
-            })
+            return await self._correct_course_tool.execute_model(CorrectCourseRequest(
+                current_situation=current_situation,
+                desired_outcome=desired_outcome,
+                change_context=change_context,
+                existing_artifacts_paths=existing_artifacts or [],
+                constraints=constraints or []
+            ))
         
         logger.info(f"Registered tools.")
 
+    def _spawn(self, coro) -> asyncio.Task:
+        """Create a task owned by this server and track it for shutdown."""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        return task
+
     async def initialize(self) -> None:
         """Ensure all components are properly initialized."""
         logger.info("Initializing server components...")
@@ -276,7 +309,15 @@ class BMadMCPServer:
         # Verify CrewAI config is ready
         if not hasattr(self.crewai_config, 'llm'):
             logger.warning("CrewAI config may not be fully initialized")
-            
+
+        # Pay the cold-start costs (schema derivation, agent construction)
+        # here instead of on the first user request
+        try:
+            await asyncio.gather(*(tool.warmup() for tool in self._native_tools))
+            logger.debug("Tool warmup complete")
+        except Exception as e:
+            logger.warning(f"Tool warmup failed (first request will pay the cold path): {e}")
+
         logger.info("Server initialization complete")
 
     async def run(self, mode: str = "stdio", host: str = "localhost", port: int = 8000) -> None:
@@ -306,13 +347,17 @@ class BMadMCPServer:
         
         # Cleanup tasks
         try:
-            # Cancel any pending tasks
-            tasks = [task for task in asyncio.all_tasks() if not task.done()]
+            # Cancel only tasks this server spawned, not FastMCP's internals
+            tasks = [task for task in self._tasks if not task.done()]
             if tasks:
                 logger.info(f"Cancelling {len(tasks)} pending tasks")
                 for task in tasks:
                     task.cancel()
-                await asyncio.gather(*tasks, return_exceptions=True)
+                # wait() is lighter than gather() here (no aggregating future)
+                # and bounds shutdown latency if a task ignores cancellation
+                _, pending = await asyncio.wait(tasks, timeout=5.0)
+                if pending:
+                    logger.warning(f"{len(pending)} tasks still pending after shutdown timeout")
         except Exception as e:
             logger.warning(f"Error during shutdown: {e}")
         
@@ -2,62 +2,68 @@
 Template loading and management for BMAD documents.
 """
 
+import importlib.resources
 from pathlib import Path
-from typing import Dict, Optional, List
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, List
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Template directory
+# Template directory (filesystem path, used by get_template_path)
 TEMPLATE_DIR = Path(__file__).parent
 
-# Template cache
-_template_cache: Dict[str, str] = {}
+# Package resources; unlike TEMPLATE_DIR this also works when the package is
+# installed as a zip/wheel without extraction
+_RESOURCES = importlib.resources.files(__package__)
+
+
+def _read_all_templates() -> Dict[str, str]:
+    """Read every shipped template resource in one pass."""
+    return {
+        resource.name: resource.read_text(encoding='utf-8')
+        for resource in _RESOURCES.iterdir()
+        if resource.name.endswith('.md') and resource.is_file()
+    }
+
+
+# Templates are static package resources, so read them all once at import into
+# a read-only mapping: lookups do no I/O and are safe for concurrent readers
+TEMPLATES: Mapping[str, str] = MappingProxyType(_read_all_templates())
 
 
 def load_template(template_name: str) -> str:
     """
     Load a BMAD template by name.
-    
+
     Args:
         template_name: Name of the template file
-        
+
     Returns:
         Template content as string
-        
+
     Raises:
         FileNotFoundError: If template doesn't exist
     """
-    if template_name in _template_cache:
-        return _template_cache[template_name]
-    
-    template_path = TEMPLATE_DIR / template_name
-    
-    if not template_path.exists():
+    try:
+        return TEMPLATES[template_name]
+    except KeyError:
         logger.error(f"Template not found: {template_name}")
         raise FileNotFoundError(f"Template not found: {template_name}")
-    
-    try:
-        with open(template_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        _template_cache[template_name] = content
-        logger.debug(f"Loaded template: {template_name}")
-        return content
-        
-    except Exception as e:
-        logger.error(f"Error loading template {template_name}: {e}")
-        raise
+
+
+# Sorted name snapshot alongside TEMPLATES; avoids re-globbing per call
+_TEMPLATE_NAMES = tuple(sorted(TEMPLATES))
 
 
 def list_templates() -> List[str]:
     """
     List available templates.
-    
+
     Returns:
         List of template file names
     """
-    return [f.name for f in TEMPLATE_DIR.glob("*.md")]
+    return list(_TEMPLATE_NAMES)
 
 
 def get_template_path(template_name: str) -> Path:
@@ -74,7 +80,8 @@ def get_template_path(template_name: str) -> Path:
 
 
 def clear_template_cache() -> None:
-    """Clear the template cache."""
-    global _template_cache
-    _template_cache.clear()
+    """Re-read all templates from disk (dev-time refresh after edits)."""
+    global TEMPLATES, _TEMPLATE_NAMES
+    TEMPLATES = MappingProxyType(_read_all_templates())
+    _TEMPLATE_NAMES = tuple(sorted(TEMPLATES))
     logger.debug("Template cache cleared")
@@ -3,12 +3,21 @@ Architecture creation tool using BMAD methodology.
 Returns generated content and suggestions to the assistant.
 """
 
+import asyncio
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Optional, Literal # Added Literal
 from datetime import datetime # Added import
 from crewai import Agent, Crew, Task, Process
 from pydantic import BaseModel, Field
 import json
 import logging
+import re
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from ..base import BMadTool
 from ...crewai_integration.agents import get_architect_agent
@@ -17,6 +26,101 @@ from ...utils.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+# Complexity and frontend signals counted in one fused pass over the PRD
+# instead of a split('\n') list plus separate whole-string scans/lowercase
+# copies; "Epic " stays case-sensitive while the other branches match any case
+_PRD_SCAN_RE = re.compile(
+    r"(?P<line>\n)|(?P<epic>Epic )|(?P<integration>(?i:integration))"
+    r"|(?P<api>(?i:api))|(?P<frontend>(?i:frontend))"
+)
+
+# Maps every non-word character to '_' for filename building in one C-level
+# substitution instead of a per-character Python generator
+_SAFE_TOPIC_RE = re.compile(r"\W")
+
+
+@dataclass(slots=True)
+class PrdStats:
+    """Signal counts gathered from a single scan of the PRD content."""
+    lines: int = 1
+    epics: int = 0
+    integrations: int = 0
+    apis: int = 0
+    has_frontend: bool = False
+
+
+def _scan_prd(prd_content: str) -> PrdStats:
+    """Collect line, epic, integration, API and frontend signals in one pass."""
+    stats = PrdStats()
+    for match in _PRD_SCAN_RE.finditer(prd_content):
+        group = match.lastgroup
+        if group == "line":
+            stats.lines += 1
+        elif group == "epic":
+            stats.epics += 1
+        elif group == "integration":
+            stats.integrations += 1
+        elif group == "api":
+            stats.apis += 1
+        else:
+            stats.has_frontend = True
+    return stats
+
+# Fixed fragments of the architecture task description, kept at module level
+# so execute() assembles the task with a single "".join allocation instead of
+# interpolating a large f-string and then appending the frontend prompt with
+# += (which copies the whole result a second time)
+_ARCH_TASK_HEADER = """
+        Create a comprehensive technical architecture document based on these requirements:
+        
+        """
+
+_ARCH_TASK_BODY = """
+        
+        Follow the BMAD architecture template structure:
+        1. Technical Summary
+        2. High-Level Overview with architecture diagrams (Mermaid format for diagrams)
+        3. Architectural/Design Patterns Adopted
+        4. Component View with detailed descriptions
+        5. Project Structure with complete directory layout (as a code block)
+        6. API Reference for external and internal APIs (if any)
+        7. Data Models with complete schemas (e.g., Pydantic models or SQL DDL)
+        8. Definitive Tech Stack Selections (including specific versions where appropriate)
+        9. Infrastructure and Deployment Overview
+        10. Error Handling Strategy
+        11. Coding Standards (focused on AI agent implementation)
+        12. Overall Testing Strategy
+        13. Security Best Practices
+        
+        Ensure the architecture:
+        - Supports all functional and non-functional requirements from the PRD.
+        - Is optimized for AI agent implementation.
+        - Follows BMAD best practices.
+        - Includes specific technology versions and justifications where critical.
+        - Provides clear implementation guidance.
+        The final output should be a complete architecture document in well-formatted markdown.
+        """
+
+# Appended to the task description when the PRD mentions a frontend; module
+# level so the literal is built once, not per call
+_FRONTEND_PROMPT = """
+
+---
+
+## Prompt for Design Architect (Frontend Architecture Mode) (To be included at the end)
+
+Based on the main architecture document above, please create a comprehensive frontend architecture that:
+
+1. **Aligns with the main technical architecture and technology selections**
+2. **Follows the BMAD frontend architecture template**
+3. **Defines component strategy, state management, and routing approaches**
+4. **Includes build, bundling, and deployment specifications**
+5. **Addresses performance, accessibility, and testing requirements**
+6. **Optimizes for AI agent implementation with clear patterns and conventions**
+
+Use the main architecture's technology stack as the foundation and elaborate on frontend-specific concerns while maintaining consistency with the overall system design.
+"""
+
 
 class TechPreferences(BaseModel):
     """Technology preferences model."""
@@ -47,6 +151,23 @@ class ArchitectureRequest(BaseModel):
 
 
 
+@lru_cache(maxsize=1)
+def _build_arch_schema() -> Dict[str, Any]:
+    """Derive the ArchitectureRequest JSON schema once, enums applied.
+
+    model_json_schema() walks the whole model graph, so the mutated schema is
+    memoized; callers must treat the returned dict as read-only.
+    """
+    schema = ArchitectureRequest.model_json_schema()
+    # Ensure enums are correctly represented
+    schema["properties"]["architecture_type"]["enum"] = ["monolith", "modular_monolith", "microservices", "serverless"]
+    # Enums for TechPreferences are often handled by Pydantic's schema generation if Literal is used,
+    # but can be explicitly set if needed, e.g., for older Pydantic or specific FastMCP behavior.
+    # For nested models, FastMCP might require explicit full schema definition if it doesn't auto-resolve.
+    # For now, assuming Pydantic schema for TechPreferences is sufficient.
+    return schema
+
+
 class CreateArchitectureTool(BMadTool):
     """
     Generates content for a technical architecture from PRD requirements using BMAD methodology.
@@ -61,27 +182,28 @@ class CreateArchitectureTool(BMadTool):
     
     def get_input_schema(self) -> Dict[str, Any]:
         """Get input schema for architecture creation using Pydantic model."""
-        schema = ArchitectureRequest.model_json_schema()
-        # Ensure enums are correctly represented
-        schema["properties"]["architecture_type"]["enum"] = ["monolith", "modular_monolith", "microservices", "serverless"]
-        # Enums for TechPreferences are often handled by Pydantic's schema generation if Literal is used,
-        # but can be explicitly set if needed, e.g., for older Pydantic or specific FastMCP behavior.
-        # For nested models, FastMCP might require explicit full schema definition if it doesn't auto-resolve.
-        # For now, assuming Pydantic schema for TechPreferences is sufficient.
-        return schema
-    
+        return _build_arch_schema()
+
+    async def warmup(self) -> None:
+        """Prime the schema and the cached architect agent at startup."""
+        await super().warmup()
+        # Agent construction builds an LLM client; keep it off the event loop
+        await asyncio.to_thread(get_architect_agent, self.crew_ai_config)
+
+
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute architecture generation and return content and suggestions."""
         try:
-            args = ArchitectureRequest(**arguments)
+            args = self._parse_args(ArchitectureRequest, arguments)
         except Exception as e:
             logger.error(f"Input validation failed for CreateArchitectureTool: {e}", exc_info=True)
             raise ValueError(f"Invalid arguments for CreateArchitectureTool: {e}")
 
         logger.info(f"Generating architecture content of type: {args.architecture_type}")
 
-        # Analyze PRD complexity
-        complexity_score = self._calculate_complexity_score(args.prd_content)
+        # Analyze PRD complexity (single scan shared with the frontend check)
+        prd_stats = _scan_prd(args.prd_content)
+        complexity_score = self._calculate_complexity_score(prd_stats)
         
         effective_architecture_type = args.architecture_type
         if complexity_score >= 8 and args.architecture_type not in ["microservices", "serverless"]:
@@ -92,64 +214,34 @@ class CreateArchitectureTool(BMadTool):
         # Create architect agent using the passed CrewAIConfig
         architect_agent = get_architect_agent(config=self.crew_ai_config)
         
+        # Dumped once and shared between the prompt and the metadata below
+        tech_dict = args.tech_preferences.model_dump(exclude_none=True) if args.tech_preferences else {}
+
         tech_prefs_text = ""
-        if args.tech_preferences:
-            tech_dict = args.tech_preferences.model_dump(exclude_none=True)
-            if tech_dict:
-                tech_prefs_text = f"Technology Preferences: {json.dumps(tech_dict, indent=2)}"
+        if tech_dict:
+            # Compact encoding: the blob goes into an LLM prompt where
+            # indentation only costs tokens; orjson when available
+            prefs_json = (
+                orjson.dumps(tech_dict).decode()
+                if orjson is not None
+                else json.dumps(tech_dict, separators=(',', ':'))
+            )
+            tech_prefs_text = f"Technology Preferences: {prefs_json}"
         
-        architecture_task_description = f"""
-        Create a comprehensive technical architecture document based on these requirements:
-        
-        {args.prd_content}
+        task_parts = [
+            _ARCH_TASK_HEADER,
+            args.prd_content,
+            f"""
         
         Architecture Parameters:
         - Architecture Type: {effective_architecture_type}
         - Complexity Score (1-10): {complexity_score}/10
-        {tech_prefs_text}
-        
-        Follow the BMAD architecture template structure:
-        1. Technical Summary
-        2. High-Level Overview with architecture diagrams (Mermaid format for diagrams)
-        3. Architectural/Design Patterns Adopted
-        4. Component View with detailed descriptions
-        5. Project Structure with complete directory layout (as a code block)
-        6. API Reference for external and internal APIs (if any)
-        7. Data Models with complete schemas (e.g., Pydantic models or SQL DDL)
-        8. Definitive Tech Stack Selections (including specific versions where appropriate)
-        9. Infrastructure and Deployment Overview
-        10. Error Handling Strategy
-        11. Coding Standards (focused on AI agent implementation)
-        12. Overall Testing Strategy
-        13. Security Best Practices
-        
-        Ensure the architecture:
-        - Supports all functional and non-functional requirements from the PRD.
-        - Is optimized for AI agent implementation.
-        - Follows BMAD best practices.
-        - Includes specific technology versions and justifications where critical.
-        - Provides clear implementation guidance.
-        The final output should be a complete architecture document in well-formatted markdown.
-        """
-
-        if args.include_frontend_prompt and "frontend" in args.prd_content.lower():
-            architecture_task_description += """
-
----
-
-## Prompt for Design Architect (Frontend Architecture Mode) (To be included at the end)
-
-Based on the main architecture document above, please create a comprehensive frontend architecture that:
-
-1. **Aligns with the main technical architecture and technology selections**
-2. **Follows the BMAD frontend architecture template**
-3. **Defines component strategy, state management, and routing approaches**
-4. **Includes build, bundling, and deployment specifications**
-5. **Addresses performance, accessibility, and testing requirements**
-6. **Optimizes for AI agent implementation with clear patterns and conventions**
-
-Use the main architecture's technology stack as the foundation and elaborate on frontend-specific concerns while maintaining consistency with the overall system design.
-"""
+        {tech_prefs_text}""",
+            _ARCH_TASK_BODY,
+        ]
+        if args.include_frontend_prompt and prd_stats.has_frontend:
+            task_parts.append(_FRONTEND_PROMPT)
+        architecture_task_description = "".join(task_parts)
 
         architecture_task = Task(
             description=architecture_task_description,
@@ -165,7 +257,9 @@ Use the main architecture's technology stack as the foundation and elaborate on
         )
         
         try:
-            result = crew.kickoff()
+            # kickoff() is synchronous and LLM-bound; run it on a worker
+            # thread so the event loop can serve other tool calls meanwhile
+            result = await asyncio.to_thread(crew.kickoff)
             generated_arch_content = result.raw if hasattr(result, 'raw') else str(result)
         except Exception as e:
             logger.error(f"CrewAI kickoff failed for architecture generation: {e}", exc_info=True)
@@ -173,7 +267,7 @@ Use the main architecture's technology stack as the foundation and elaborate on
         
         # Determine a suggested path
         prd_topic_line = args.prd_content.split('\n', 1)[0] # Get first line for a hint
-        safe_topic = "".join(c if c.isalnum() else '_' for c in prd_topic_line[:30]).strip('_').lower()
+        safe_topic = _SAFE_TOPIC_RE.sub('_', prd_topic_line[:30]).strip('_').lower()
         if not safe_topic: safe_topic = "architecture"
         suggested_path = f"architecture/arch_{effective_architecture_type}_{safe_topic}.md"
 
@@ -182,7 +276,7 @@ Use the main architecture's technology stack as the foundation and elaborate on
             status="draft",
             architecture_type=effective_architecture_type,
             complexity_score=complexity_score,
-            tech_preferences_used=args.tech_preferences.model_dump(exclude_none=True) if args.tech_preferences else {}
+            tech_preferences_used=tech_dict
         )
         
         logger.info(f"Architecture document content generated for type: {effective_architecture_type}")
@@ -194,17 +288,13 @@ Use the main architecture's technology stack as the foundation and elaborate on
             "message": "Architecture document content generated. Please review and save."
         }
     
-    def _calculate_complexity_score(self, prd_content: str) -> int:
-        """Calculate architecture complexity score based on PRD content."""
-        prd_lines = len(prd_content.split('\n'))
-        epic_count = prd_content.count("Epic ") # Case-sensitive count
-        integration_count = prd_content.lower().count("integration")
-        api_count = prd_content.lower().count("api")
-        
-        complexity_factors = [
-            min(prd_lines // 100, 3),  # Adjusted divisor for lines
-            min(epic_count // 2, 3),   # Adjusted for epic count
-            min(integration_count // 2, 2),
-            min(api_count // 2, 2)
-        ]
-        return max(1, min(sum(complexity_factors), 10)) # Ensure score is at least 1
+    def _calculate_complexity_score(self, stats: PrdStats) -> int:
+        """Calculate architecture complexity score from PRD scan stats."""
+        score = (
+            (3 if stats.lines >= 300 else stats.lines // 100)        # Adjusted divisor for lines
+            + (3 if stats.epics >= 6 else stats.epics // 2)          # Adjusted for epic count
+            + (2 if stats.integrations >= 4 else stats.integrations // 2)
+            + (2 if stats.apis >= 4 else stats.apis // 2)
+        )
+        # Capped factors sum to at most 10, so only the floor of 1 needs enforcing
+        return score if score > 1 else 1
@@ -3,11 +3,15 @@ Frontend architecture creation tool using BMAD methodology.
 Returns generated content and suggestions to the assistant.
 """
 
+import asyncio
+from functools import lru_cache
 from typing import Any, Dict, Optional, Literal
 from datetime import datetime
 from crewai import Agent, Crew, Task, Process
 from pydantic import BaseModel, Field
+import hashlib
 import logging
+import re
 
 from ..base import BMadTool
 from ...crewai_integration.agents import get_architect_agent
@@ -16,6 +20,80 @@ from ...utils.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+# UI complexity signals collected in one fused case-insensitive pass instead
+# of seven substring scans over a lowercase copy of the whole document; each
+# named group maps to one scoring branch
+_UI_COMPLEXITY_RE = re.compile(
+    r"(?P<dash>dashboard|admin)"
+    r"|(?P<rt>real-time|websocket)"
+    r"|(?P<mob>mobile|responsive)"
+    r"|(?P<auth>authentication|auth)"
+    r"|(?P<api>api)"
+    r"|(?P<ms>microservice)"
+    r"|(?P<spa>spa|single page application)",
+    re.IGNORECASE
+)
+
+# Static instruction block placed first in the task description so the prefix
+# stays byte-identical across calls and provider-side prompt caching can reuse
+# it; dynamic inputs (documents, parameters) follow it
+_FRONTEND_TASK_PREFIX = """
+        Create a comprehensive frontend architecture based on the main technical architecture document and the UX specifications (if any) provided after these instructions.
+
+        Follow the BMAD frontend architecture template structure:
+        1. Frontend Technical Summary & Goals
+        2. Alignment with Main Architecture (Key integration points, API consumption)
+        3. Chosen Frontend Stack (Framework, UI libraries, State Management, Build tools - with versions)
+        4. Directory Structure for Frontend Code (as a code block)
+        5. Component Design Strategy (per the requested strategy in the parameters, examples of component hierarchy)
+        6. State Management Approach (Detailed strategy, choice justification)
+        7. Routing Strategy
+        8. API Integration Strategy (How frontend interacts with backend APIs)
+        9. Build, Bundling, and Deployment Process
+        10. Frontend Testing Strategy (Unit, Integration, E2E)
+        11. Performance Considerations & Optimizations
+        12. Accessibility (A11Y) Guidelines
+        13. Security Considerations for Frontend
+        14. Coding Standards & Conventions for Frontend (e.g., naming, formatting)
+
+        Ensure the frontend architecture:
+        - Is consistent with the main technical architecture.
+        - Is optimized for AI agent implementation if applicable to UI generation or component creation.
+        - Follows modern frontend best practices.
+        - Provides clear guidance for frontend development.
+        The final output should be a complete frontend architecture document in well-formatted markdown.
+        """
+
+# Exact-match response cache: the CrewAI kickoff dominates execute() by
+# seconds, so identical regenerations (same documents and preferences, modulo
+# whitespace) return the stored content instead of a second LLM round trip
+_RESPONSE_CACHE: Dict[str, str] = {}
+_RESPONSE_CACHE_MAX = 64
+
+
+def _response_cache_key(args: "FrontendArchitectureRequest") -> str:
+    """Hash the request fields, whitespace-normalized, into a cache key."""
+    payload = "\x1f".join((
+        " ".join(args.main_architecture_content.split()),
+        " ".join(args.ux_specification_content.split()),
+        args.framework_preference,
+        args.component_strategy,
+        args.state_management,
+    ))
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+# Score contribution per matched signal group
+_UI_COMPLEXITY_WEIGHTS = {
+    "dash": 2,
+    "rt": 2,
+    "mob": 1,
+    "auth": 1,
+    "api": 1,  # "api" is very generic, might need refinement
+    "ms": 1,   # Main arch type, might imply complex FE if many services
+    "spa": 1,
+}
+
 
 class FrontendArchitectureRequest(BaseModel):
     """Request model for frontend architecture creation."""
@@ -39,6 +117,24 @@ class FrontendArchitectureRequest(BaseModel):
     )
 
 
+@lru_cache(maxsize=1)
+def _build_frontend_schema() -> Dict[str, Any]:
+    """Derive the FrontendArchitectureRequest JSON schema once, enums applied.
+
+    Memoized for the same reason as the main architecture schema; callers must
+    treat the returned dict as read-only.
+    """
+    schema = FrontendArchitectureRequest.model_json_schema()
+    # Add enum constraints to match server.py registration if they are Literals there
+    schema["properties"]["component_strategy"]["enum"] = ["atomic", "modular", "feature-based", "layered"]
+    # Ensure framework_preference and state_management allow empty string if that's the intent for "any"
+    # Or define specific enums if choices are limited.
+    # For server.py, framework_preference is Optional[Literal["React", ..., ""]]
+    # Pydantic schema should reflect this if strict validation is desired.
+    # For now, keeping as string, server-side Literal will handle validation.
+    return schema
+
+
 class CreateFrontendArchitectureTool(BMadTool):
     """
     Generates content for frontend-specific architecture specifications using BMAD methodology.
@@ -53,75 +149,89 @@ class CreateFrontendArchitectureTool(BMadTool):
     
     def get_input_schema(self) -> Dict[str, Any]:
         """Get input schema for frontend architecture creation using Pydantic model."""
-        schema = FrontendArchitectureRequest.model_json_schema()
-        # Add enum constraints to match server.py registration if they are Literals there
-        schema["properties"]["component_strategy"]["enum"] = ["atomic", "modular", "feature-based", "layered"]
-        # Ensure framework_preference and state_management allow empty string if that's the intent for "any"
-        # Or define specific enums if choices are limited.
-        # For server.py, framework_preference is Optional[Literal["React", ..., ""]]
-        # Pydantic schema should reflect this if strict validation is desired.
-        # For now, keeping as string, server-side Literal will handle validation.
-        return schema
-    
+        return _build_frontend_schema()
+
+    async def warmup(self) -> None:
+        """Prime the schema and the cached architect agent at startup."""
+        await super().warmup()
+        # Agent construction builds an LLM client; keep it off the event loop
+        await asyncio.to_thread(get_architect_agent, self.crew_ai_config)
+
+
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute frontend architecture generation and return content and suggestions."""
         try:
             # Map server.py argument names to Pydantic model field names if different
             # 'main_architecture' from server.py maps to 'main_architecture_content' here if we used alias
             # For now, assuming direct mapping or that server.py uses the model's field names
-            args = FrontendArchitectureRequest(**arguments)
+            args = self._parse_args(FrontendArchitectureRequest, arguments)
         except Exception as e:
             logger.error(f"Input validation failed for CreateFrontendArchitectureTool: {e}", exc_info=True)
             raise ValueError(f"Invalid arguments for CreateFrontendArchitectureTool: {e}")
 
         logger.info(f"Generating frontend architecture content, preferred framework: {args.framework_preference or 'None'}")
 
+        cache_key = _response_cache_key(args)
+        cached_content = _RESPONSE_CACHE.get(cache_key)
+
         frontend_complexity = self._analyze_frontend_complexity(args.main_architecture_content)
-        
-        # Create architect agent using the passed CrewAIConfig
-        architect_agent = get_architect_agent(config=self.crew_ai_config)
-        
-        ux_spec_info = f"UX Specification Content:\n{args.ux_specification_content}\n" if args.ux_specification_content else "No UX specification content provided. Infer frontend requirements from the main architecture and general best practices."
 
-        task_description = f"""
-        Based on the main technical architecture document provided below, and the UX specifications (if any), 
-        create a comprehensive frontend architecture.
+        if cached_content is not None:
+            logger.info("Returning cached frontend architecture content for identical request")
+            generated_frontend_arch_content = cached_content
+        else:
+            generated_frontend_arch_content = await self._generate_content(args, frontend_complexity)
+            if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+                _RESPONSE_CACHE.pop(next(iter(_RESPONSE_CACHE)))
+            _RESPONSE_CACHE[cache_key] = generated_frontend_arch_content
 
-        Main Architecture Content:
-        {args.main_architecture_content}
+        # Determine a suggested path
+        framework_suffix = args.framework_preference.lower().replace(' ', '_').replace('.', '') if args.framework_preference else "generic"
+        suggested_path = f"architecture/frontend_architecture_{framework_suffix}.md"
 
-        {ux_spec_info}
+        suggested_metadata = self.create_suggested_metadata(
+            artifact_type="frontend_architecture_document",
+            status="draft",
+            framework_preference=args.framework_preference,
+            component_strategy=args.component_strategy,
+            state_management=args.state_management,
+            complexity_score=frontend_complexity
+        )
+
+        logger.info(f"Frontend architecture content generated for framework: {args.framework_preference or 'generic'}")
+
+        return {
+            "content": generated_frontend_arch_content,
+            "suggested_path": suggested_path,
+            "metadata": suggested_metadata,
+            "message": "Frontend architecture content generated. Please review and save."
+        }
+
+    async def _generate_content(self, args: FrontendArchitectureRequest, frontend_complexity: int) -> str:
+        """Run the CrewAI kickoff for a cache miss and return the raw content."""
+        # Create architect agent using the passed CrewAIConfig
+        architect_agent = get_architect_agent(config=self.crew_ai_config)
 
+        ux_spec_info = f"UX Specification Content:\n{args.ux_specification_content}\n" if args.ux_specification_content else "No UX specification content provided. Infer frontend requirements from the main architecture and general best practices."
+
+        # Static prefix first, dynamic inputs last (prompt-cache friendly);
+        # assembled with one join
+        task_description = "".join((
+            _FRONTEND_TASK_PREFIX,
+            f"""
         Frontend Architecture Parameters:
         - Preferred Framework: {args.framework_preference or 'Not specified, choose a suitable modern framework.'}
         - Component Strategy: {args.component_strategy}
         - Preferred State Management: {args.state_management or 'Not specified, recommend based on framework and complexity.'}
         - Frontend Complexity Score: {frontend_complexity}/10
-            
-        Follow the BMAD frontend architecture template structure:
-        1. Frontend Technical Summary & Goals
-        2. Alignment with Main Architecture (Key integration points, API consumption)
-        3. Chosen Frontend Stack (Framework, UI libraries, State Management, Build tools - with versions)
-        4. Directory Structure for Frontend Code (as a code block)
-        5. Component Design Strategy (e.g., {args.component_strategy}, examples of component hierarchy)
-        6. State Management Approach (Detailed strategy, choice justification)
-        7. Routing Strategy
-        8. API Integration Strategy (How frontend interacts with backend APIs)
-        9. Build, Bundling, and Deployment Process
-        10. Frontend Testing Strategy (Unit, Integration, E2E)
-        11. Performance Considerations & Optimizations
-        12. Accessibility (A11Y) Guidelines
-        13. Security Considerations for Frontend
-        14. Coding Standards & Conventions for Frontend (e.g., naming, formatting)
 
-        Ensure the frontend architecture:
-        - Is consistent with the main technical architecture.
-        - Is optimized for AI agent implementation if applicable to UI generation or component creation.
-        - Follows modern frontend best practices.
-        - Provides clear guidance for frontend development.
-        The final output should be a complete frontend architecture document in well-formatted markdown.
-        """
-        
+        Main Architecture Content:
+        {args.main_architecture_content}
+
+        {ux_spec_info}
+        """,
+        ))
+
         frontend_arch_task = Task(
             description=task_description,
             expected_output="Complete frontend architecture document in markdown format, adhering to the BMAD frontend template.",
@@ -136,52 +246,21 @@ class CreateFrontendArchitectureTool(BMadTool):
         )
         
         try:
-            result = crew.kickoff()
-            generated_frontend_arch_content = result.raw if hasattr(result, 'raw') else str(result)
+            # kickoff() is synchronous and LLM-bound; run it on a worker
+            # thread so the event loop can serve other tool calls meanwhile
+            result = await asyncio.to_thread(crew.kickoff)
+            return result.raw if hasattr(result, 'raw') else str(result)
         except Exception as e:
             logger.error(f"CrewAI kickoff failed for frontend architecture generation: {e}", exc_info=True)
             raise Exception(f"Frontend architecture generation by CrewAI failed: {e}")
-        
-        # Determine a suggested path
-        framework_suffix = args.framework_preference.lower().replace(' ', '_').replace('.', '') if args.framework_preference else "generic"
-        suggested_path = f"architecture/frontend_architecture_{framework_suffix}.md"
 
-        suggested_metadata = self.create_suggested_metadata(
-            artifact_type="frontend_architecture_document",
-            status="draft",
-            framework_preference=args.framework_preference,
-            component_strategy=args.component_strategy,
-            state_management=args.state_management,
-            complexity_score=frontend_complexity
-        )
-        
-        logger.info(f"Frontend architecture content generated for framework: {args.framework_preference or 'generic'}")
-        
-        return {
-            "content": generated_frontend_arch_content,
-            "suggested_path": suggested_path,
-            "metadata": suggested_metadata,
-            "message": "Frontend architecture content generated. Please review and save."
-        }
-    
     def _analyze_frontend_complexity(self, main_architecture_content: str) -> int:
         """Analyze frontend complexity based on main architecture."""
-        arch_lower = main_architecture_content.lower()
-        
-        ui_complexity = 0
-        if "dashboard" in arch_lower or "admin" in arch_lower:
-            ui_complexity += 2
-        if "real-time" in arch_lower or "websocket" in arch_lower:
-            ui_complexity += 2
-        if "mobile" in arch_lower or "responsive" in arch_lower:
-            ui_complexity += 1
-        if "authentication" in arch_lower or "auth" in arch_lower:
-            ui_complexity += 1
-        if "api" in arch_lower: # This is very generic, might need refinement
-            ui_complexity += 1
-        if "microservice" in arch_lower: # Main arch type, might imply complex FE if many services
-            ui_complexity += 1 
-        if "spa" in arch_lower or "single page application" in arch_lower:
-            ui_complexity += 1
-        
+        seen = set()
+        for match in _UI_COMPLEXITY_RE.finditer(main_architecture_content):
+            seen.add(match.lastgroup)
+            if len(seen) == len(_UI_COMPLEXITY_WEIGHTS):
+                break
+
+        ui_complexity = sum(_UI_COMPLEXITY_WEIGHTS[group] for group in seen)
         return min(ui_complexity, 10)
@@ -3,15 +3,25 @@ Base classes and interfaces for BMAD MCP tools.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 from datetime import datetime
+import asyncio
 import logging
+import re
+
+from pydantic import BaseModel, TypeAdapter
 
 from ..utils.state_manager import StateManager
 from ..crewai_integration.config import CrewAIConfig
 
 logger = logging.getLogger(__name__)
 
+# Inserts '_' before each non-leading uppercase letter; one C-level pass
+# instead of a per-character Python loop. Results are memoized per class name
+# since tool names never change after definition.
+_CAMEL_RE = re.compile(r'(?<!^)(?=[A-Z])')
+_SNAKE_CACHE: Dict[str, str] = {}
+
 
 class BMadTool(ABC):
     """
@@ -42,8 +52,8 @@ class BMadTool(ABC):
         if class_name.endswith('Tool'):
             class_name = class_name[:-4]  # Remove 'Tool' suffix
         
-        # Convert CamelCase to snake_case
-        self.name = self._camel_to_snake(class_name)
+        # Convert CamelCase to snake_case (cached per class name)
+        self.name = _SNAKE_CACHE.setdefault(class_name, self._camel_to_snake(class_name))
         
         # Description from docstring or default
         self.description = self.__doc__ or f"BMAD {self.name} tool"
@@ -73,7 +83,23 @@ class BMadTool(ABC):
             Exception: If tool execution fails
         """
         pass
-    
+
+    async def execute_model(self, request: BaseModel) -> Dict[str, Any]:
+        """
+        Execute the tool with an already-validated Pydantic request model.
+
+        Server wrappers build the request model directly from FastMCP's typed
+        arguments; tools recognise their own model instance in execute() and
+        skip re-validating a dict round-trip of the same fields.
+
+        Args:
+            request: Validated request model instance for this tool
+
+        Returns:
+            A dictionary with the tool's output.
+        """
+        return await self.execute(request)  # type: ignore[arg-type]
+
     @abstractmethod
     def get_input_schema(self) -> Dict[str, Any]:
         """
@@ -84,6 +110,123 @@ class BMadTool(ABC):
         """
         pass
     
+    @staticmethod
+    def extract_usage_telemetry(result: Any) -> Dict[str, Any]:
+        """
+        Pull token usage and provider cache-hit counters off a kickoff result.
+
+        Providers only discount prompt tokens they served from cache, so
+        surfacing cached_tokens/cache_hit_ratio in artifact metadata makes a
+        prompt restructure that silently breaks prefix caching visible.
+        Returns an empty dict when the CrewAI version exposes no usage data.
+
+        Args:
+            result: The object returned by crew.kickoff()
+
+        Returns:
+            A dict with prompt_tokens, cached_tokens and cache_hit_ratio,
+            or {} if usage information is unavailable.
+        """
+        usage = getattr(result, "token_usage", None)
+        if usage is None:
+            return {}
+        if hasattr(usage, "model_dump"):
+            usage = usage.model_dump()
+        elif not isinstance(usage, dict):
+            usage = getattr(usage, "__dict__", None) or {}
+
+        prompt_tokens = usage.get("prompt_tokens") or 0
+        cached_tokens = usage.get("cached_prompt_tokens")
+        if cached_tokens is None:
+            details = usage.get("prompt_tokens_details")
+            cached_tokens = details.get("cached_tokens", 0) if isinstance(details, dict) else 0
+
+        return {
+            "prompt_tokens": prompt_tokens,
+            "cached_tokens": cached_tokens,
+            "cache_hit_ratio": round(cached_tokens / prompt_tokens, 3) if prompt_tokens else 0.0,
+        }
+
+    async def batch_execute(self, arguments_list: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Execute the tool concurrently for several independent argument sets.
+
+        execute() implementations run their CrewAI kickoff on a worker thread,
+        so N independent invocations overlap their LLM waits instead of
+        serializing: wall-clock time approaches the slowest call rather than
+        the sum. Failures come back in-place as exception objects
+        (return_exceptions=True) so one bad request does not discard the rest.
+
+        Args:
+            arguments_list: One arguments dict (or request model) per invocation
+
+        Returns:
+            A list of result dicts and/or exceptions, in input order.
+        """
+        return await asyncio.gather(
+            *(self.execute(arguments) for arguments in arguments_list),
+            return_exceptions=True
+        )
+
+    async def warmup(self) -> None:
+        """
+        Pre-build per-tool state so the first real request avoids cold paths.
+
+        The server awaits this for every tool after startup. The base
+        implementation derives and caches the input schema; subclasses that
+        have other first-call costs (e.g. CrewAI agent construction) should
+        extend it.
+        """
+        self.input_schema()
+
+    # Pre-built validators, keyed per request model; TypeAdapter skips the
+    # class-level machinery that model_cls(**arguments) goes through per call
+    _adapter_cache: ClassVar[Dict[type, TypeAdapter]] = {}
+
+    @staticmethod
+    def _parse_args(model_cls: type, arguments: Any) -> Any:
+        """
+        Return arguments as a validated model_cls instance.
+
+        Instances built by the server wrappers pass through untouched (FastMCP
+        already validated them against the wrapper signature); dicts from other
+        callers are validated through a cached TypeAdapter. model_construct is
+        deliberately not used for dict input: skipping validation on
+        unverified shapes just trades an upfront ValueError for an
+        AttributeError deep in execution.
+
+        Args:
+            model_cls: The tool's request model class
+            arguments: Either an instance of model_cls or a raw argument dict
+
+        Returns:
+            A validated model_cls instance.
+        """
+        if isinstance(arguments, model_cls):
+            return arguments
+        adapter = BMadTool._adapter_cache.get(model_cls)
+        if adapter is None:
+            adapter = BMadTool._adapter_cache[model_cls] = TypeAdapter(model_cls)
+        return adapter.validate_python(arguments)
+
+    # Derived JSON schemas, keyed per tool class; model_json_schema() walks the
+    # whole request model, so derive each schema once instead of per call
+    _input_schema_cache: ClassVar[Dict[type, Dict[str, Any]]] = {}
+
+    def input_schema(self) -> Dict[str, Any]:
+        """
+        Cached wrapper around get_input_schema().
+
+        Returns:
+            The JSON schema for this tool class, derived once and shared;
+            callers must not mutate it.
+        """
+        cls = type(self)
+        schema = BMadTool._input_schema_cache.get(cls)
+        if schema is None:
+            schema = BMadTool._input_schema_cache[cls] = self.get_input_schema()
+        return schema
+
     def validate_input(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate and normalize input arguments.
@@ -97,7 +240,7 @@ class BMadTool(ABC):
         Raises:
             ValueError: If validation fails
         """
-        schema = self.get_input_schema()
+        schema = self.input_schema()
         required_fields = schema.get("required", [])
         
         # Check required fields
@@ -125,11 +268,12 @@ class BMadTool(ABC):
         Returns:
             Metadata dictionary with standard fields for suggestion.
         """
+        now = datetime.now().isoformat()
         metadata = {
             "artifact_type": artifact_type,
             "status": status,
-            "suggested_created_at": datetime.now().isoformat(),
-            "suggested_updated_at": datetime.now().isoformat(),
+            "suggested_created_at": now,
+            "suggested_updated_at": now,
             "generated_by_tool": self.name,
             "bmad_version": "1.0"
         }
@@ -138,12 +282,7 @@ class BMadTool(ABC):
     
     def _camel_to_snake(self, name: str) -> str:
         """Convert CamelCase to snake_case."""
-        result = []
-        for i, char in enumerate(name):
-            if char.isupper() and i > 0:
-                result.append('_')
-            result.append(char.lower())
-        return ''.join(result)
+        return _CAMEL_RE.sub('_', name).lower()
     
     def get_tool_info(self) -> Dict[str, Any]:
         """
@@ -156,7 +295,7 @@ class BMadTool(ABC):
             "name": self.name,
             "description": self.description,
             "category": self.category,
-            "input_schema": self.get_input_schema()
+            "input_schema": self.input_schema()
         }
 
 
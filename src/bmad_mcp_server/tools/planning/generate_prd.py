@@ -3,7 +3,11 @@ PRD generation tool using BMAD methodology.
 Returns generated content and suggestions to the assistant.
 """
 
+import asyncio
+import hashlib
 import json
+import re
+from functools import lru_cache
 from typing import Any, Dict, Optional, Literal
 from datetime import datetime
 from crewai import Agent, Crew, Task, Process
@@ -17,6 +21,69 @@ from ...utils.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+# Maps every non-word character to '_' for filename building in one C-level
+# substitution instead of a per-character Python generator
+_SAFE_TOPIC_RE = re.compile(r"\W")
+
+# Exact-match response cache keyed on the brief hash and generation options:
+# rerunning the tool on unchanged input returns the stored PRD instead of a
+# second multi-second LLM round trip, making retries effectively free
+_RESPONSE_CACHE: Dict[str, str] = {}
+_RESPONSE_CACHE_MAX = 64
+
+
+def _response_cache_key(args: "PRDGenerationRequest") -> str:
+    """Hash the brief and generation options into a cache key."""
+    payload = "\x1f".join((
+        args.project_brief_content,
+        args.workflow_mode,
+        args.technical_depth,
+        str(args.include_architecture_prompt),
+    ))
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+# Epic section headings ('Epic 1', '## Epic 2: ...') anchored at line start;
+# one C-level scan that, unlike count('Epic '), skips prose like 'Epic scope'
+_EPIC_RE = re.compile(r'^\s*(?:#{1,6}\s*)?Epic\s+\d+', re.MULTILINE)
+
+# Static instruction blocks come first in the task description and dynamic
+# inputs (brief, parameters) last, so the instruction prefix stays
+# byte-identical across calls and provider-side prompt caching can reuse it
+_PRD_TASK_PREFIX = """
+        Create a comprehensive Product Requirements Document (PRD) based on the project brief provided after these instructions.
+
+        Follow the BMAD PRD template structure:
+        1. Goal, Objective and Context
+        2. Functional Requirements (MVP)
+        3. Non Functional Requirements (MVP)
+        4. User Interaction and Design Goals (if UI applicable)
+        5. Technical Assumptions
+        6. Epic Overview with detailed user stories (Ensure each epic has a clear goal, 3-5 user stories with acceptance criteria, and logical sequencing)
+        7. Out of Scope Ideas Post MVP
+
+        Focus on creating actionable, development-ready requirements.
+        The final output should be a complete PRD document in well-formatted markdown.
+        """
+
+_PRD_ARCHITECT_PROMPT = """
+Additionally, append the following section verbatim as the final section of the PRD:
+
+---
+
+## Initial Architect Prompt (To be included at the end of the PRD)
+
+Based on the requirements analysis above, please create a comprehensive technical architecture that:
+
+1. **Supports all functional and non-functional requirements**
+2. **Follows the technical assumptions and constraints outlined**
+3. **Provides clear technology stack selections with justification**
+4. **Includes detailed component design and data flow**
+5. **Addresses security, scalability, and performance considerations**
+6. **Optimizes for AI agent implementation and BMAD methodology**
+
+Use the BMAD architecture template and ensure the design enables efficient development execution by AI agents following the defined epics and stories.
+"""
+
 
 class PRDGenerationRequest(BaseModel):
     """Request model for PRD generation."""
@@ -48,6 +115,22 @@ class PRDGenerationRequest(BaseModel):
 
 
 
+@lru_cache(maxsize=1)
+def _build_prd_schema() -> Dict[str, Any]:
+    """Derive the PRDGenerationRequest JSON schema once, enums applied.
+
+    model_json_schema() walks the whole model, so the mutated schema is
+    memoized; callers must treat the returned dict as read-only.
+    """
+    schema = PRDGenerationRequest.model_json_schema()
+    # Ensure enum constraints are present if not automatically added by Pydantic/FastMCP
+    if "enum" not in schema["properties"]["workflow_mode"]:
+        schema["properties"]["workflow_mode"]["enum"] = ["incremental", "yolo"]
+    if "enum" not in schema["properties"]["technical_depth"]:
+        schema["properties"]["technical_depth"]["enum"] = ["basic", "standard", "detailed"]
+    return schema
+
+
 class GeneratePRDTool(BMadTool):
     """
     Generates content for a comprehensive PRD with epics and user stories using BMAD methodology.
@@ -61,18 +144,12 @@ class GeneratePRDTool(BMadTool):
     
     def get_input_schema(self) -> Dict[str, Any]:
         """Get input schema for PRD generation using Pydantic model."""
-        schema = PRDGenerationRequest.model_json_schema()
-        # Ensure enum constraints are present if not automatically added by Pydantic/FastMCP
-        if "enum" not in schema["properties"]["workflow_mode"]:
-             schema["properties"]["workflow_mode"]["enum"] = ["incremental", "yolo"]
-        if "enum" not in schema["properties"]["technical_depth"]:
-            schema["properties"]["technical_depth"]["enum"] = ["basic", "standard", "detailed"]
-        return schema
+        return _build_prd_schema()
     
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute PRD generation and return content and suggestions."""
         try:
-            args = PRDGenerationRequest(**arguments)
+            args = self._parse_args(PRDGenerationRequest, arguments)
         except Exception as e:
             logger.error(f"Input validation failed for GeneratePRDTool: {e}", exc_info=True)
             raise ValueError(f"Invalid arguments for GeneratePRDTool: {e}")
@@ -80,82 +157,30 @@ class GeneratePRDTool(BMadTool):
         logger.info(f"Generating PRD content based on brief (first 100 chars): {args.project_brief_content[:100]}...")
         
         # Analyze brief complexity to adjust technical depth (can be part of agent's logic too)
-        brief_lines = len(args.project_brief_content.split('\n'))
+        brief_lines = args.project_brief_content.count('\n') + 1
         effective_technical_depth = args.technical_depth
         if brief_lines > 50 and args.technical_depth == "standard":
             effective_technical_depth = "detailed"
         elif brief_lines < 20 and args.technical_depth == "standard":
             effective_technical_depth = "basic"
         
-        # Create PM agent using the passed CrewAIConfig
-        pm_agent = get_pm_agent(config=self.crew_ai_config)
-        
-        prd_task_description = f"""
-        Create a comprehensive Product Requirements Document (PRD) based on this project brief:
-        
-        {args.project_brief_content}
-        
-        Workflow mode: {args.workflow_mode}
-        Technical depth: {effective_technical_depth}
-        
-        Follow the BMAD PRD template structure:
-        1. Goal, Objective and Context
-        2. Functional Requirements (MVP)
-        3. Non Functional Requirements (MVP)
-        4. User Interaction and Design Goals (if UI applicable)
-        5. Technical Assumptions
-        6. Epic Overview with detailed user stories (Ensure each epic has a clear goal, 3-5 user stories with acceptance criteria, and logical sequencing)
-        7. Out of Scope Ideas Post MVP
-        
-        Focus on creating actionable, development-ready requirements.
-        The final output should be a complete PRD document in well-formatted markdown.
-        """
-
-        if args.include_architecture_prompt:
-            prd_task_description += """
+        cache_key = _response_cache_key(args)
+        cached_content = _RESPONSE_CACHE.get(cache_key)
+        if cached_content is not None:
+            logger.info("Returning cached PRD content for identical request")
+            generated_prd_content = cached_content
+            usage_telemetry: Dict[str, Any] = {}
+        else:
+            generated_prd_content, usage_telemetry = await self._generate_content(args, effective_technical_depth)
+            if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+                _RESPONSE_CACHE.pop(next(iter(_RESPONSE_CACHE)))
+            _RESPONSE_CACHE[cache_key] = generated_prd_content
 
----
-
-## Initial Architect Prompt (To be included at the end of the PRD)
+        epics_count = sum(1 for _ in _EPIC_RE.finditer(generated_prd_content))
 
-Based on the requirements analysis above, please create a comprehensive technical architecture that:
-
-1. **Supports all functional and non-functional requirements**
-2. **Follows the technical assumptions and constraints outlined**
-3. **Provides clear technology stack selections with justification**
-4. **Includes detailed component design and data flow**
-5. **Addresses security, scalability, and performance considerations**
-6. **Optimizes for AI agent implementation and BMAD methodology**
-
-Use the BMAD architecture template and ensure the design enables efficient development execution by AI agents following the defined epics and stories.
-"""
-        
-        prd_task = Task(
-            description=prd_task_description,
-            expected_output="A complete PRD document in markdown format, adhering to the BMAD template structure. If requested, include the 'Initial Architect Prompt' section at the end.",
-            agent=pm_agent
-        )
-        
-        crew = Crew(
-            agents=[pm_agent],
-            tasks=[prd_task],
-            process=Process.sequential,
-            verbose=self.crew_ai_config.verbose_logging # Use config for verbosity
-        )
-        
-        try:
-            result = crew.kickoff()
-            generated_prd_content = result.raw if hasattr(result, 'raw') else str(result)
-        except Exception as e:
-            logger.error(f"CrewAI kickoff failed for PRD generation: {e}", exc_info=True)
-            # Re-raise to be caught by server's MCP handler, which will format an MCPError
-            raise Exception(f"PRD generation by CrewAI failed: {e}") 
-        
-        epics_count = generated_prd_content.count("Epic ")
-        
         # Determine a suggested path
         brief_topic_line = args.project_brief_content.split('\n', 1)[0]
-        safe_topic = "".join(c if c.isalnum() else '_' for c in brief_topic_line[:50]).strip('_').lower()
+        safe_topic = _SAFE_TOPIC_RE.sub('_', brief_topic_line[:50]).strip('_').lower()
         if not safe_topic: safe_topic = "prd"
         suggested_path = f"prd/prd_{safe_topic}.md"
 
@@ -165,15 +190,73 @@ Use the BMAD architecture template and ensure the design enables efficient devel
             workflow_mode=args.workflow_mode,
             technical_depth=effective_technical_depth,
             epics_count=epics_count,
-            include_architecture_prompt=args.include_architecture_prompt
+            include_architecture_prompt=args.include_architecture_prompt,
+            **usage_telemetry
         )
-        
+
         logger.info(f"PRD content generated by tool. Epics found: {epics_count}.")
-        
+
         return {
             "content": generated_prd_content,
             "suggested_path": suggested_path,
             "metadata": suggested_metadata,
             "message": "PRD content generated. Please review and save."
         }
+
+    async def _generate_content(self, args: PRDGenerationRequest, effective_technical_depth: str) -> tuple:
+        """Run the CrewAI kickoff for a cache miss; returns (content, usage telemetry)."""
+        # Create PM agent using the passed CrewAIConfig
+        pm_agent = get_pm_agent(config=self.crew_ai_config)
+
+        # Static instruction blocks first, dynamic inputs last (prompt-cache
+        # friendly prefix); assembled with one join
+        task_parts = [_PRD_TASK_PREFIX]
+        if args.include_architecture_prompt:
+            task_parts.append(_PRD_ARCHITECT_PROMPT)
+        task_parts.append(f"""
+        Workflow mode: {args.workflow_mode}
+        Technical depth: {effective_technical_depth}
+
+        Project Brief:
+        {args.project_brief_content}
+        """)
+        prd_task_description = "".join(task_parts)
+
+
+        prd_task = Task(
+            description=prd_task_description,
+            expected_output="A complete PRD document in markdown format, adhering to the BMAD template structure. If requested, include the 'Initial Architect Prompt' section at the end.",
+            agent=pm_agent
+        )
+
+        try:
+            # Both paths are synchronous and LLM-bound, so they run on a
+            # worker thread and the event loop can serve other calls meanwhile
+            if args.workflow_mode == "yolo":
+                # Single task, single agent: run the task directly and skip
+                # Crew's sequential-pipeline orchestration overhead. The
+                # incremental path keeps the Crew so future multi-task flows
+                # have somewhere to live.
+                result = await asyncio.to_thread(pm_agent.execute_task, prd_task)
+            else:
+                crew = Crew(
+                    agents=[pm_agent],
+                    tasks=[prd_task],
+                    process=Process.sequential,
+                    verbose=self.crew_ai_config.verbose_logging # Use config for verbosity
+                )
+                result = await asyncio.to_thread(crew.kickoff)
+            usage_telemetry = self.extract_usage_telemetry(result)
+            if usage_telemetry:
+                logger.info(
+                    f"PRD kickoff usage: {usage_telemetry['prompt_tokens']} prompt tokens, "
+                    f"{usage_telemetry['cached_tokens']} cached "
+                    f"(hit ratio {usage_telemetry['cache_hit_ratio']})"
+                )
+            content = result.raw if hasattr(result, 'raw') else str(result)
+            return content, usage_telemetry
+        except Exception as e:
+            logger.error(f"CrewAI kickoff failed for PRD generation: {e}", exc_info=True)
+            # Re-raise to be caught by server's MCP handler, which will format an MCPError
+            raise Exception(f"PRD generation by CrewAI failed: {e}")
     
@@ -3,7 +3,10 @@ Project Brief creation tool using BMAD methodology.
 Returns generated content and suggestions to the assistant.
 """
 
+import asyncio
+import hashlib
 import logging
+import os
 from typing import Any, Dict
 from datetime import datetime
 
@@ -16,6 +19,70 @@ from ...crewai_integration.agents import get_analyst_agent
 
 logger = logging.getLogger(__name__)
 
+# One-pass filename sanitizer replacing the chain of .replace() calls, each
+# of which copied the whole topic string
+_TOPIC_TRANS = str.maketrans({' ': '_', '.': None, '/': '_', '\\': '_'})
+
+# Static instruction block placed first in the task description so the prefix
+# stays byte-identical across calls and provider-side prompt caching can reuse
+# it; dynamic inputs (topic, audience, constraints, context) follow it
+_BRIEF_TASK_PREFIX = """
+        Create a comprehensive project brief for the topic and project named in the parameters after these instructions.
+
+        Follow a standard BMAD project brief template structure, including sections for:
+        1. Introduction / Problem Statement
+        2. Vision & Goals (with specific, measurable goals)
+        3. Target Audience / Users
+        4. Key Features / Scope (High-Level Ideas for MVP)
+        5. Post MVP Features / Scope and Ideas
+        6. Known Technical Constraints or Preferences
+
+        Ensure the brief is detailed enough to guide PRD creation and provides
+        clear direction for the project scope and objectives. The output should be clean Markdown.
+        """
+
+# Input schema built once at import time instead of per get_input_schema()
+# call (the server re-queries schemas whenever a client lists tools); callers
+# must treat it as read-only
+_BRIEF_INPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "topic": {
+            "type": "string",
+            "description": "The main topic or idea for the project"
+        },
+        "target_audience": {
+            "type": "string",
+            "description": "Target audience or users for the project",
+            "default": "General users"
+        },
+        "constraints": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Known constraints, preferences, or requirements",
+            "default": []
+        },
+        "scope_level": {
+            "type": "string",
+            "enum": ["minimal", "standard", "comprehensive"],
+            "description": "Desired scope level for the brief",
+            "default": "standard"
+        },
+        "additional_context": {
+            "type": "string",
+            "description": "Additional context, requirements, or information to include in the brief generation",
+            "default": ""
+        }
+    },
+    "required": ["topic"]
+}
+
+# Exact-match response cache keyed on the fully-rendered task description
+# (which folds in topic, audience, constraints, scope, any existing brief and
+# additional context): identical re-invocations skip the LLM round trip
+_RESPONSE_CACHE: Dict[str, str] = {}
+_RESPONSE_CACHE_MAX = 64
+
 
 class CreateProjectBriefTool(BMadTool):
     """
@@ -30,38 +97,7 @@ class CreateProjectBriefTool(BMadTool):
     
     def get_input_schema(self) -> Dict[str, Any]:
         """Get input schema for project brief creation."""
-        return {
-            "type": "object",
-            "properties": {
-                "topic": {
-                    "type": "string",
-                    "description": "The main topic or idea for the project"
-                },
-                "target_audience": {
-                    "type": "string",
-                    "description": "Target audience or users for the project",
-                    "default": "General users"
-                },
-                "constraints": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Known constraints, preferences, or requirements",
-                    "default": []
-                },
-                "scope_level": {
-                    "type": "string",
-                    "enum": ["minimal", "standard", "comprehensive"],
-                    "description": "Desired scope level for the brief",
-                    "default": "standard"
-                },
-                "additional_context": {
-                    "type": "string",
-                    "description": "Additional context, requirements, or information to include in the brief generation",
-                    "default": ""
-                }
-            },
-            "required": ["topic"]
-        }
+        return _BRIEF_INPUT_SCHEMA
     
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute project brief creation and return content and suggestions."""
@@ -82,24 +118,30 @@ class CreateProjectBriefTool(BMadTool):
         # Check for existing project brief content - simplified to avoid path issues
         existing_brief_content = ""
         try:
-            # Try to find existing project briefs using direct file system access
+            # Find the most recently modified "*project_brief*.md" in one
+            # scandir sweep; DirEntry caches the stat so each file costs one
+            # syscall instead of the glob + per-file stat of the old max()
             ideation_dir = self.state_manager.get_bmad_dir() / "ideation"
+            latest = None
             if ideation_dir.exists():
-                # Find markdown files that contain "project_brief" in the name
-                brief_files = list(ideation_dir.glob("*project_brief*.md"))
-                if brief_files:
-                    # Use the most recently modified file
-                    latest_brief_file = max(brief_files, key=lambda f: f.stat().st_mtime)
-                    relative_path = latest_brief_file.relative_to(self.state_manager.get_bmad_dir())
-                    brief_data = await self.state_manager.load_artifact(str(relative_path))
-                    existing_brief_content = brief_data["content"]
-                    logger.info(f"Found existing project brief: {relative_path}")
+                with os.scandir(ideation_dir) as entries:
+                    for entry in entries:
+                        if (
+                            entry.is_file()
+                            and "project_brief" in entry.name
+                            and entry.name.endswith(".md")
+                        ):
+                            mtime = entry.stat().st_mtime
+                            if latest is None or mtime > latest[0]:
+                                latest = (mtime, entry.name)
+            if latest is not None:
+                relative_path = f"ideation/{latest[1]}"
+                brief_data = await self.state_manager.load_artifact(relative_path)
+                existing_brief_content = brief_data["content"]
+                logger.info(f"Found existing project brief: {relative_path}")
         except Exception as e:
             logger.debug(f"No existing project brief found or error loading: {e}")
         
-        # Create analyst agent using the passed CrewAIConfig
-        analyst = get_analyst_agent(config=self.crew_ai_config)
-        
         # Build context sections for the task
         context_sections = []
         
@@ -128,44 +170,59 @@ Please incorporate this additional context into the project brief.
         
         context_text = "\n".join(context_sections)
         
-        # Define the CrewAI task
-        task_description = f"""
-        Create a comprehensive project brief for the topic: '{topic}' for project '{project_name}'.
+        # Define the CrewAI task: static prefix first, dynamic inputs last
+        # (prompt-cache friendly); assembled with one join
+        task_description = "".join((
+            _BRIEF_TASK_PREFIX,
+            f"""
+        Topic: '{topic}' for project '{project_name}'.
         Target audience: {target_audience}
         Known constraints: {', '.join(constraints) if constraints else 'None specified'}
         Scope level: {scope_level}
-        
+
         {context_text}
-        
-        Follow a standard BMAD project brief template structure, including sections for:
-        1. Introduction / Problem Statement
-        2. Vision & Goals (with specific, measurable goals)
-        3. Target Audience / Users
-        4. Key Features / Scope (High-Level Ideas for MVP)
-        5. Post MVP Features / Scope and Ideas
-        6. Known Technical Constraints or Preferences
-        
-        Ensure the brief is detailed enough to guide PRD creation and provides
-        clear direction for the project scope and objectives. The output should be clean Markdown.
-        """
-        brief_task = Task(
-            description=task_description,
-            expected_output="A complete project brief in markdown format.",
-            agent=analyst
-        )
-        
-        crew = Crew(
-            agents=[analyst],
-            tasks=[brief_task],
-            process=Process.sequential,
-            verbose=self.crew_ai_config.verbose_logging
-        )
-        
-        result = crew.kickoff()
-        generated_content = result.raw if hasattr(result, 'raw') else str(result)
-        
+        """,
+        ))
+        cache_key = hashlib.blake2b(task_description.encode(), digest_size=16).hexdigest()
+        cached_content = _RESPONSE_CACHE.get(cache_key)
+        usage_telemetry: Dict[str, Any] = {}
+        if cached_content is not None:
+            logger.info(f"Returning cached project brief content for '{topic}'")
+            generated_content = cached_content
+        else:
+            # Create analyst agent using the passed CrewAIConfig
+            analyst = get_analyst_agent(config=self.crew_ai_config)
+
+            brief_task = Task(
+                description=task_description,
+                expected_output="A complete project brief in markdown format.",
+                agent=analyst
+            )
+
+            crew = Crew(
+                agents=[analyst],
+                tasks=[brief_task],
+                process=Process.sequential,
+                verbose=self.crew_ai_config.verbose_logging
+            )
+
+            # kickoff() is synchronous and LLM-bound; run it on a worker
+            # thread so the event loop can serve other tool calls meanwhile
+            result = await asyncio.to_thread(crew.kickoff)
+            usage_telemetry = self.extract_usage_telemetry(result)
+            if usage_telemetry:
+                logger.info(
+                    f"Brief kickoff usage: {usage_telemetry['prompt_tokens']} prompt tokens, "
+                    f"{usage_telemetry['cached_tokens']} cached "
+                    f"(hit ratio {usage_telemetry['cache_hit_ratio']})"
+                )
+            generated_content = result.raw if hasattr(result, 'raw') else str(result)
+            if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+                _RESPONSE_CACHE.pop(next(iter(_RESPONSE_CACHE)))
+            _RESPONSE_CACHE[cache_key] = generated_content
+
         # Prepare the structured response for the assistant
-        file_name_safe_topic = topic.lower().replace(' ', '_').replace('.', '').replace('/', '_').replace('\\', '_')
+        file_name_safe_topic = topic.lower().translate(_TOPIC_TRANS)
         suggested_path = f"ideation/project_brief_{file_name_safe_topic}.md"
 
         suggested_metadata = self.create_suggested_metadata(
@@ -173,7 +230,8 @@ Please incorporate this additional context into the project brief.
             status="draft", 
             topic=topic, 
             target_audience=target_audience,
-            scope_level=scope_level
+            scope_level=scope_level,
+            **usage_telemetry
         )
         
         logger.info(f"Project brief content for '{topic}' generated by tool.")
@@ -3,6 +3,7 @@ Requirements validation tool using BMAD methodology.
 Returns the validation report content to the assistant.
 """
 
+from functools import lru_cache
 from typing import Any, Dict, List, Literal
 from datetime import datetime
 from pydantic import BaseModel, Field
@@ -15,6 +16,23 @@ from ...crewai_integration.config import CrewAIConfig
 
 logger = logging.getLogger(__name__)
 
+# Readiness policy as one sorted (threshold, readiness, assessment line)
+# table scanned high-to-low, instead of an if/elif ladder inside the report
+# formatter; the final 0 tier always matches since pass rates are >= 0
+_READINESS = (
+    (90, "ready", "🟢 **READY FOR ARCHITECTURE** - PRD meets BMAD quality standards\n"),
+    (80, "mostly_ready", "🟡 **MOSTLY READY** - Minor improvements recommended before architecture phase\n"),
+    (70, "needs_improvement", "🟠 **NEEDS IMPROVEMENT** - Address key issues before proceeding\n"),
+    (0, "not_ready", "🔴 **NOT READY** - Significant revision required\n"),
+)
+
+# Per-section status icon tiers, same shape as _READINESS
+_SECTION_ICONS = (
+    (80, "✅"),
+    (60, "⚠️"),
+    (0, "❌"),
+)
+
 
 class RequirementsValidationRequest(BaseModel):
     """Request model for requirements validation."""
@@ -33,6 +51,21 @@ class RequirementsValidationRequest(BaseModel):
     )
     # No Config.json_schema_extra needed if enums are handled by FastMCP or tool logic
 
+
+@lru_cache(maxsize=1)
+def _build_validation_schema() -> Dict[str, Any]:
+    """Derive the RequirementsValidationRequest JSON schema once, enums applied.
+
+    model_json_schema() walks the whole model, so the mutated schema is
+    memoized; callers must treat the returned dict as read-only.
+    """
+    schema = RequirementsValidationRequest.model_json_schema()
+    # Explicitly define enums for clarity if not automatically picked up by FastMCP from Literal in server
+    schema["properties"]["checklist_type"]["enum"] = ["pm_checklist", "standard", "comprehensive"]
+    schema["properties"]["validation_mode"]["enum"] = ["strict", "standard", "lenient"]
+    return schema
+
+
 class ValidateRequirementsTool(BMadTool):
     """
     Validate PRD documents against PM quality checklists using BMAD methodology.
@@ -49,16 +82,12 @@ class ValidateRequirementsTool(BMadTool):
     
     def get_input_schema(self) -> Dict[str, Any]:
         """Get input schema for requirements validation using Pydantic model."""
-        schema = RequirementsValidationRequest.model_json_schema()
-        # Explicitly define enums for clarity if not automatically picked up by FastMCP from Literal in server
-        schema["properties"]["checklist_type"]["enum"] = ["pm_checklist", "standard", "comprehensive"]
-        schema["properties"]["validation_mode"]["enum"] = ["strict", "standard", "lenient"]
-        return schema
+        return _build_validation_schema()
     
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute requirements validation and return report content and suggestions."""
         try:
-            args = RequirementsValidationRequest(**arguments)
+            args = self._parse_args(RequirementsValidationRequest, arguments)
         except Exception as e:
             logger.error(f"Input validation failed for ValidateRequirementsTool: {e}", exc_info=True)
             raise ValueError(f"Invalid arguments for ValidateRequirementsTool: {e}")
@@ -133,64 +162,65 @@ class ValidateRequirementsTool(BMadTool):
         na_items = validation_result.na_items
         
         pass_rate = (passed_items / total_items * 100) if total_items > 0 else 0
-        
-        report = f"# BMAD Requirements Validation Report\n\n"
-        report += f"## Checklist: {checklist_name_display.replace('_', ' ').title()}\n\n" # Use display name
-        report += f"### Validation Summary\n"
-        report += f"- **Document Length:** {document_length:,} characters\n"
-        report += f"- **Total Quality Items:** {total_items}\n"
-        report += f"- **Passed Items:** {passed_items} ✅\n"
-        report += f"- **Failed Items:** {failed_items} ❌\n"
-        report += f"- **Not Applicable:** {na_items} ⚪\n"
-        report += f"- **Quality Score:** {pass_rate:.1f}%\n\n"
-        
-        report += "### Readiness Assessment\n"
-        readiness = "not_ready" # Default
-        if pass_rate >= 90:
-            report += "🟢 **READY FOR ARCHITECTURE** - PRD meets BMAD quality standards\n"
-            readiness = "ready"
-        elif pass_rate >= 80:
-            report += "🟡 **MOSTLY READY** - Minor improvements recommended before architecture phase\n"
-            readiness = "mostly_ready"
-        elif pass_rate >= 70:
-            report += "🟠 **NEEDS IMPROVEMENT** - Address key issues before proceeding\n"
-            readiness = "needs_improvement"
-        else:
-            report += "🔴 **NOT READY** - Significant revision required\n"
-            # readiness remains "not_ready"
-        
+
+        # Fragments are collected in a list and joined once at the end;
+        # repeated `report += ...` re-copied the whole report per statement,
+        # O(N^2) bytes on checklists with many sections and failed items
+        parts = [
+            f"# BMAD Requirements Validation Report\n\n"
+            f"## Checklist: {checklist_name_display.replace('_', ' ').title()}\n\n"  # Use display name
+            f"### Validation Summary\n"
+            f"- **Document Length:** {document_length:,} characters\n"
+            f"- **Total Quality Items:** {total_items}\n"
+            f"- **Passed Items:** {passed_items} ✅\n"
+            f"- **Failed Items:** {failed_items} ❌\n"
+            f"- **Not Applicable:** {na_items} ⚪\n"
+            f"- **Quality Score:** {pass_rate:.1f}%\n\n"
+            "### Readiness Assessment\n"
+        ]
+        for threshold, readiness, assessment_line in _READINESS:
+            if pass_rate >= threshold:
+                parts.append(assessment_line)
+                break
+
         if validation_result.section_results:
-            report += "\n\n### Section Quality Breakdown\n"
+            parts.append("\n\n### Section Quality Breakdown\n")
             for section in validation_result.section_results:
                 section_pass_rate = (section.passed / section.total * 100) if section.total > 0 else 0
-                status_icon = "✅" if section_pass_rate >= 80 else "⚠️" if section_pass_rate >= 60 else "❌"
-                report += f"- **{section.title}:** {section.passed}/{section.total} ({section_pass_rate:.0f}%) {status_icon}\n"
-        
+                status_icon = next(icon for threshold, icon in _SECTION_ICONS if section_pass_rate >= threshold)
+                parts.append(f"- **{section.title}:** {section.passed}/{section.total} ({section_pass_rate:.0f}%) {status_icon}\n")
+
         if validation_result.failed_items_details and include_recommendations:
-            report += "\n\n### Critical Issues to Address\n"
+            parts.append("\n\n### Critical Issues to Address\n")
             for i, item in enumerate(validation_result.failed_items_details, 1):
-                report += f"{i}. **{item['category']}:** {item['description']}\n"
+                parts.append(f"{i}. **{item['category']}:** {item['description']}\n")
                 if item.get('recommendation'):
-                    report += f"   *Action:* {item['recommendation']}\n"
-        
+                    parts.append(f"   *Action:* {item['recommendation']}\n")
+
         if validation_result.recommendations and include_recommendations:
-            report += "\n\n### Improvement Recommendations\n"
+            parts.append("\n\n### Improvement Recommendations\n")
             for i, rec in enumerate(validation_result.recommendations, 1):
-                report += f"{i}. {rec}\n"
-        
-        report += f"\n\n### Next Steps Suggested\n"
+                parts.append(f"{i}. {rec}\n")
+
+        parts.append("\n\n### Next Steps Suggested\n")
         if readiness == "ready":
-            report += "- ✅ PRD is ready for architecture phase.\n"
-            report += "- Proceed with technical architecture design.\n"
-            report += "- Consider addressing any remaining minor issues for optimal quality.\n"
+            parts.append(
+                "- ✅ PRD is ready for architecture phase.\n"
+                "- Proceed with technical architecture design.\n"
+                "- Consider addressing any remaining minor issues for optimal quality.\n"
+            )
         elif readiness == "mostly_ready":
-            report += "- 🔄 Address failed items for optimal quality.\n"
-            report += "- Re-validate after improvements (optional).\n"
-            report += "- Can proceed to architecture with caution, ensuring identified gaps are covered.\n"
+            parts.append(
+                "- 🔄 Address failed items for optimal quality.\n"
+                "- Re-validate after improvements (optional).\n"
+                "- Can proceed to architecture with caution, ensuring identified gaps are covered.\n"
+            )
         else:
-            report += "- ❌ Address all critical issues before proceeding.\n"
-            report += "- Re-run validation after improvements.\n"
-            report += "- Do not proceed to architecture phase until quality standards are met.\n"
-        
+            parts.append(
+                "- ❌ Address all critical issues before proceeding.\n"
+                "- Re-run validation after improvements.\n"
+                "- Do not proceed to architecture phase until quality standards are met.\n"
+            )
+
         # Removed the footer: "*Generated using BMAD MCP Server...*"
-        return report.strip()
+        return "".join(parts).strip()
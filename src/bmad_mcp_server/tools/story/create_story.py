@@ -3,7 +3,10 @@ Story creation tool using BMAD methodology.
 Returns generated content and suggestions to the assistant.
 """
 
+import asyncio
 import json
+import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Literal
 from datetime import datetime
 from crewai import Agent, Crew, Task, Process
@@ -17,6 +20,11 @@ from ...utils.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+# Matches whole lines containing a markdown heading marker; one C-level scan
+# over the PRD that visits only heading lines, instead of splitting the whole
+# document into a line list and testing every line in Python
+_HEADING_LINE_RE = re.compile(r'^[^\n]*##[^\n]*$', re.MULTILINE)
+
 
 class CurrentProgress(BaseModel):
     """Model for tracking current project progress."""
@@ -42,6 +50,20 @@ class CreateStoryRequest(BaseModel):
     )
 
 
+@lru_cache(maxsize=1)
+def _build_story_schema() -> Dict[str, Any]:
+    """Derive the CreateStoryRequest JSON schema once, enums applied.
+
+    model_json_schema() walks the whole model, so the mutated schema is
+    memoized; callers must treat the returned dict as read-only.
+    """
+    schema = CreateStoryRequest.model_json_schema()
+    # Ensure enums are correctly represented
+    schema["properties"]["story_type"]["enum"] = ["feature", "bug", "technical", "research", "epic"]
+    schema["properties"]["priority"]["enum"] = ["low", "medium", "high", "critical"]
+    return schema
+
+
 class CreateNextStoryTool(BMadTool):
     """
     Generates content for the next development-ready user story based on PRD and architecture.
@@ -56,16 +78,12 @@ class CreateNextStoryTool(BMadTool):
     
     def get_input_schema(self) -> Dict[str, Any]:
         """Get input schema for story creation using Pydantic model."""
-        schema = CreateStoryRequest.model_json_schema()
-        # Ensure enums are correctly represented
-        schema["properties"]["story_type"]["enum"] = ["feature", "bug", "technical", "research", "epic"]
-        schema["properties"]["priority"]["enum"] = ["low", "medium", "high", "critical"]
-        return schema
+        return _build_story_schema()
     
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute story generation and return content and suggestions."""
         try:
-            args = CreateStoryRequest(**arguments)
+            args = self._parse_args(CreateStoryRequest, arguments)
         except Exception as e:
             logger.error(f"Input validation failed for CreateNextStoryTool: {e}", exc_info=True)
             raise ValueError(f"Invalid arguments for CreateNextStoryTool: {e}")
@@ -140,7 +158,9 @@ class CreateNextStoryTool(BMadTool):
         )
         
         try:
-            result = crew.kickoff()
+            # kickoff() is synchronous and LLM-bound; run it on a worker
+            # thread so the event loop can serve other tool calls meanwhile
+            result = await asyncio.to_thread(crew.kickoff)
             generated_story_content = result.raw if hasattr(result, 'raw') else str(result)
         except Exception as e:
             logger.error(f"CrewAI kickoff failed for story generation: {e}", exc_info=True)
@@ -185,11 +205,14 @@ class CreateNextStoryTool(BMadTool):
         # This would ideally parse the PRD to find the current epic and the next uncompleted story.
         # For now, it just provides a generic context based on the epic number.
         
-        # This is a very naive way to find an epic title.
+        # This is a very naive way to find an epic title. The regex yields
+        # only heading lines, so the per-line Python work is limited to the
+        # handful of headings in the PRD and stops at the first match.
         epic_title_search = f"Epic {progress.current_epic}"
         epic_title_found = "Unknown Epic"
-        for line in prd_content.split('\n'):
-            if epic_title_search in line and ("###" in line or "##" in line):
+        for match in _HEADING_LINE_RE.finditer(prd_content):
+            line = match.group()
+            if epic_title_search in line:
                 epic_title_found = line.replace("###","").replace("##","").replace(epic_title_search, "").strip().split(':',1)[0].strip()
                 break
         
@@ -67,7 +67,7 @@ class ValidateStoryTool(BMadTool):
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute story validation and return report content and suggestions."""
         try:
-            args = StoryValidationRequest(**arguments)
+            args = self._parse_args(StoryValidationRequest, arguments)
         except Exception as e:
             logger.error(f"Input validation failed for ValidateStoryTool: {e}", exc_info=True)
             raise ValueError(f"Invalid arguments for ValidateStoryTool: {e}")
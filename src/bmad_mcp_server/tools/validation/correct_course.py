@@ -3,6 +3,7 @@ Course correction tool for BMAD change management.
 Returns a suggested course correction plan to the assistant.
 """
 
+import asyncio
 from typing import Any, Dict, List, Optional, Literal as PyLiteral
 from datetime import datetime
 from crewai import Agent, Crew, Task, Process
@@ -82,7 +83,7 @@ class CorrectCourseTool(BMadTool):
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute course correction analysis and return plan content and suggestions."""
         try:
-            args = CorrectCourseRequest(**arguments)
+            args = self._parse_args(CorrectCourseRequest, arguments)
         except Exception as e:
             logger.error(f"Input validation failed for CorrectCourseTool: {e}", exc_info=True)
             raise ValueError(f"Invalid arguments for CorrectCourseTool: {e}")
@@ -157,7 +158,9 @@ class CorrectCourseTool(BMadTool):
         )
         
         try:
-            result = crew.kickoff()
+            # kickoff() is synchronous and LLM-bound; run it on a worker
+            # thread so the event loop can serve other tool calls meanwhile
+            result = await asyncio.to_thread(crew.kickoff)
             correction_plan_content = result.raw if hasattr(result, 'raw') else str(result)
         except Exception as e:
             logger.error(f"CrewAI kickoff failed for course correction: {e}", exc_info=True)
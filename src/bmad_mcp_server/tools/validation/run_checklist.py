@@ -77,7 +77,7 @@ class RunChecklistTool(BMadTool):
         """Execute checklist validation and return report content and suggestions."""
         try:
             # Pydantic will convert string to Enum for checklist_name if it's a valid member
-            args = ChecklistRequest(**arguments)
+            args = self._parse_args(ChecklistRequest, arguments)
         except Exception as e:
             logger.error(f"Input validation failed for RunChecklistTool: {e}", exc_info=True)
             # Provide available checklist names in error if it's a checklist_name issue
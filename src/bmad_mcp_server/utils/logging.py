@@ -3,12 +3,18 @@ Logging configuration for BMAD MCP Server.
 """
 
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 from rich.logging import RichHandler
 from rich.console import Console
 
+# Listener thread draining file log records; module-level so a repeated
+# setup_logging call can stop the previous one
+_file_log_listener: Optional[QueueListener] = None
+
 
 def setup_logging(
     level: str = "INFO",
@@ -61,12 +67,29 @@ def setup_logging(
     root_logger.addHandler(console_handler)
     
     # File handler (if specified)
+    global _file_log_listener
+    if _file_log_listener is not None:
+        _file_log_listener.stop()
+        _file_log_listener = None
+
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setFormatter(detailed_formatter)
         file_handler.setLevel(numeric_level)
-        root_logger.addHandler(file_handler)
+
+        # Route file writes through a queue so log calls inside async tool
+        # wrappers never block the event loop thread on disk I/O; a
+        # background listener thread drains the queue into the file handler
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(numeric_level)
+        root_logger.addHandler(queue_handler)
+
+        _file_log_listener = QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _file_log_listener.start()
     
     # Set specific logger levels
     logging.getLogger("bmad_mcp_server").setLevel(numeric_level)
@@ -8,6 +8,7 @@ project metadata.
 
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime
@@ -44,6 +45,7 @@ class StateManager:
         self.bmad_dir = self.project_root / self.bmad_dir_name
         self._lock = None  # Will be initialized when needed
         self._initialized = False
+        self._meta_cache: Optional[tuple] = None  # (mtime_ns, meta dict)
         
         # Try to ensure structure synchronously first
         try:
@@ -183,25 +185,89 @@ class StateManager:
         async with lock:
             full_path = self.bmad_dir / path_in_bmad
             full_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Add YAML frontmatter for markdown files if metadata provided
-            if metadata and path_in_bmad.endswith('.md'):
-                # Ensure metadata has required fields
-                if 'created_at' not in metadata:
-                    metadata['created_at'] = datetime.now().isoformat()
-                metadata['updated_at'] = datetime.now().isoformat()
-                
-                frontmatter_str = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
-                file_content = f"---\n{frontmatter_str}---\n\n{content}"
-            else:
-                file_content = content
-            
+
+            file_content = self._render_artifact(path_in_bmad, content, metadata)
+
             async with aiofiles.open(full_path, 'w', encoding='utf-8') as f:
                 await f.write(file_content)
-            
+
             # Update artifact count in project metadata
             await self._update_artifact_count(path_in_bmad, increment=True)
-            
+
+            logger.info(f"Saved artifact: {path_in_bmad}")
+            return str(full_path)
+
+    def _render_artifact(
+        self,
+        path_in_bmad: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]]
+    ) -> str:
+        """Render artifact content, adding YAML frontmatter for markdown files."""
+        if metadata and path_in_bmad.endswith('.md'):
+            # Ensure metadata has required fields
+            if 'created_at' not in metadata:
+                metadata['created_at'] = datetime.now().isoformat()
+            metadata['updated_at'] = datetime.now().isoformat()
+
+            frontmatter_str = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
+            return f"---\n{frontmatter_str}---\n\n{content}"
+        return content
+
+    async def save_artifact_and_advance_phase(
+        self,
+        path_in_bmad: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        phase: Optional[str] = None
+    ) -> str:
+        """
+        Save an artifact and advance the project phase in one batch.
+
+        Equivalent to save_artifact() followed by update_project_phase(), but
+        acquires the state lock once and rewrites project_meta.json a single
+        time covering both the artifact count and the phase change, so there
+        is no intermediate state where the artifact exists but the phase is
+        stale.
+
+        Args:
+            path_in_bmad: Relative path within .bmad directory
+            content: Main content of the artifact
+            metadata: Optional metadata to include as YAML frontmatter
+            phase: Optional new phase name
+
+        Returns:
+            Absolute path to the saved file
+        """
+        lock = await self._get_lock()
+        async with lock:
+            full_path = self.bmad_dir / path_in_bmad
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+
+            file_content = self._render_artifact(path_in_bmad, content, metadata)
+
+            async with aiofiles.open(full_path, 'w', encoding='utf-8') as f:
+                await f.write(file_content)
+
+            # Single metadata read-modify-write covering count and phase
+            try:
+                meta = await self.load_json("project_meta.json")
+                artifact_type = path_in_bmad.split("/")[0] if "/" in path_in_bmad else "root"
+                now = datetime.now().isoformat()
+
+                if artifact_type in meta.get("artifact_count", {}):
+                    meta["artifact_count"][artifact_type] += 1
+                meta["updated_at"] = now
+                if phase is not None:
+                    meta["current_phase"] = phase
+                    meta[f"phase_{phase}_started_at"] = now
+
+                meta_path = self.bmad_dir / "project_meta.json"
+                async with aiofiles.open(meta_path, 'w', encoding='utf-8') as f:
+                    await f.write(json.dumps(meta, indent=2, ensure_ascii=False))
+            except Exception as e:
+                logger.warning(f"Failed to update project metadata for {path_in_bmad}: {e}")
+
             logger.info(f"Saved artifact: {path_in_bmad}")
             return str(full_path)
     
@@ -308,11 +374,28 @@ class StateManager:
     async def get_project_meta(self) -> Dict[str, Any]:
         """
         Get current project metadata.
-        
+
+        The parsed metadata is cached against the file's mtime_ns, so
+        repeated reads between writes skip the disk read and JSON decode;
+        any write to project_meta.json (here or externally) bumps the mtime
+        and invalidates the cache. Callers must treat the returned dict as
+        read-only.
+
         Returns:
             Project metadata dictionary
         """
-        return await self.load_json("project_meta.json")
+        try:
+            mtime_ns = os.stat(self.bmad_dir / "project_meta.json").st_mtime_ns
+        except OSError:
+            return await self.load_json("project_meta.json")
+
+        cached = self._meta_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        meta = await self.load_json("project_meta.json")
+        self._meta_cache = (mtime_ns, meta)
+        return meta
     
     async def list_artifacts(
         self, 